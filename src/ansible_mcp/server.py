@@ -1,24 +1,45 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Awaitable, Callable, Iterable
+import asyncio
+import configparser
+import fnmatch
 import json
 import os
 import shlex
+import shutil
+import stat
 import subprocess
 import sys
 import tempfile
+import threading
 from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 import time
 import hashlib
 import re
 from datetime import datetime, timedelta
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import yaml
 from mcp.server.fastmcp import FastMCP
 
+try:
+    # libyaml bindings are an order of magnitude faster than the pure-Python codecs
+    from yaml import CSafeDumper as _YDumper, CSafeLoader as _YLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YDumper, SafeLoader as _YLoader  # type: ignore[assignment]
+
+try:
+    # optional accelerator for JSON encode/decode (pip install "mcp-ansible[fast]")
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 mcp = FastMCP("ansible-mcp")
 
@@ -27,36 +48,345 @@ def _ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def _run_command(command: list[str], cwd: Path | None = None, env: dict[str, str] | None = None) -> tuple[int, str, str]:
-    process = subprocess.Popen(
+# integer literals that may not fit orjson's 64-bit range (some releases turn them into
+# floats silently); a match inside a string only costs the slower stdlib parse
+_WIDE_INT_STR = re.compile(r"\d{20}|-\d{19}").search
+_WIDE_INT_BYTES = re.compile(rb"\d{20}|-\d{19}").search
+
+
+def _json_loads(data: str | bytes) -> Any:
+    if orjson is not None and not (_WIDE_INT_STR if isinstance(data, str) else _WIDE_INT_BYTES)(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity, which ansible-inventory emits for YAML .nan/.inf
+            pass
+    return json.loads(data)
+
+
+def _json_dumps(data: Any, indent: bool = False) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0))
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder copes
+            pass
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+
+def _json_text(data: Any) -> str:
+    return _json_dumps(data).decode("utf-8")
+
+
+# executable name -> absolute path, per PATH value; only hits are remembered
+_WHICH_CACHE: dict[tuple[str, str | None], str] = {}
+
+
+def _spawn_options(command: list[str], env: dict[str, str] | None, pass_fds: tuple[int, ...]) -> dict[str, Any]:
+    """Popen options that keep CPython on its posix_spawn() fast path where it can be.
+
+    That path needs an absolute executable and close_fds=False (our own descriptors are
+    non-inheritable anyway, PEP 446); with a cwd or pass_fds CPython uses vfork() instead.
+    """
+    exe = command[0]
+    if not os.path.dirname(exe):
+        search_path = env["PATH"] if env and "PATH" in env else os.environ.get("PATH")
+        key = (exe, search_path)
+        resolved = _WHICH_CACHE.get(key)
+        if resolved is None:
+            resolved = shutil.which(exe, path=search_path)
+            if resolved is not None:
+                _WHICH_CACHE[key] = resolved
+        exe = resolved
+    return {"executable": exe, "close_fds": bool(pass_fds)}
+
+
+def _drain(fd: int, buf: bytearray) -> None:
+    read = os.read
+    while chunk := read(fd, 65536):
+        buf += chunk
+
+
+def _run_command(command: list[str], cwd: Path | None = None, env: dict[str, str] | None = None, pass_fds: tuple[int, ...] = ()) -> tuple[int, str, str]:
+    # only build a merged environment when there are overrides; None inherits ours
+    merged_env = {**os.environ, **env} if env else None
+    out_buf, err_buf = bytearray(), bytearray()
+    # unbuffered binary pipes drained straight into bytearrays: no chunk list to join,
+    # and each stream is decoded exactly once
+    with subprocess.Popen(
         command,
         cwd=str(cwd) if cwd else None,
-        env={**os.environ.copy(), **(env or {})},
+        env=merged_env,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
+        bufsize=0,
+        pass_fds=pass_fds,
+        **_spawn_options(command, env, pass_fds),
+    ) as proc:
+        err_reader = threading.Thread(target=_drain, args=(proc.stderr.fileno(), err_buf), daemon=True)
+        err_reader.start()
+        _drain(proc.stdout.fileno(), out_buf)
+        err_reader.join()
+    return proc.returncode, out_buf.decode("utf-8", "replace"), err_buf.decode("utf-8", "replace")
+
+
+# -v .. -vvvv, indexed by verbosity level - 1
+_VERBOSE_FLAGS = ("-v", "-vv", "-vvv", "-vvvv")
+
+
+@lru_cache(maxsize=64)
+def _mode_flags(check: bool, diff: bool, verbose: int) -> tuple[str, ...]:
+    """Trailing --check/--diff/-v* flags shared by the playbook and ad-hoc builders."""
+    flags: list[str] = []
+    if check:
+        flags.append("--check")
+    if diff:
+        flags.append("--diff")
+    if verbose:
+        flags.append(_VERBOSE_FLAGS[max(0, min(verbose - 1, 3))])
+    return tuple(flags)
+
+# Verbosity at which playbook/ad-hoc output is spooled to log files instead of memory
+_STREAM_VERBOSITY = 3
+# Bytes of each spooled stream returned inline
+_STREAM_TAIL_BYTES = 64 * 1024
+# Spooled logs older than this are removed when the next one is created
+_STREAM_LOG_MAX_AGE = 24 * 3600
+
+
+def _read_tail(fd: int, limit: int) -> str:
+    size = os.lseek(fd, 0, os.SEEK_END)
+    os.lseek(fd, max(0, size - limit), os.SEEK_SET)
+    data = os.read(fd, limit)
+    if size > limit:
+        # drop the partial first line
+        data = data.split(b"\n", 1)[-1]
+    return data.decode("utf-8", "replace")
+
+
+async def _arun_command(command: list[str], cwd: Path | None = None, env: dict[str, str] | None = None, pass_fds: tuple[int, ...] = (), on_line: Callable[[str], Awaitable[None]] | None = None) -> tuple[int, str, str]:
+    """Awaitable counterpart of _run_command for long-running ansible invocations.
+
+    The event loop keeps serving other tool calls while the child runs; if the
+    calling task is cancelled the child is killed rather than orphaned. With
+    ``on_line``, each stdout line is passed to it as soon as it is read.
+    """
+    merged_env = {**os.environ, **env} if env else None
+    proc = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=str(cwd) if cwd else None,
+        env=merged_env,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        pass_fds=pass_fds,
+        **_spawn_options(command, env, pass_fds),
     )
-    stdout, stderr = process.communicate()
-    return process.returncode, stdout, stderr
+    try:
+        if on_line is None:
+            out, err = await proc.communicate()
+        else:
+            out, err = await _read_lines(proc, on_line)
+    except BaseException:
+        # cancellation, or on_line failing: never leave the child blocked on a full pipe
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+        raise
+    return proc.returncode, out.decode("utf-8", "replace"), err.decode("utf-8", "replace")
+
+
+async def _read_lines(proc: asyncio.subprocess.Process, on_line: Callable[[str], Awaitable[None]]) -> tuple[bytes, bytes]:
+    # fixed-size reads rather than StreamReader.readline, which fails on lines over 64 KiB
+    # (a single -v result line can be far larger)
+    err_task = asyncio.ensure_future(proc.stderr.read())
+    out = bytearray()
+    # pieces of the unfinished line; only each new chunk is searched, so a huge line is
+    # joined once when it ends rather than re-copied on every read
+    pending: list[bytes] = []
+    try:
+        while chunk := await proc.stdout.read(65536):
+            out += chunk
+            start = 0
+            while (end := chunk.find(b"\n", start)) >= 0:
+                line = chunk[start:end]
+                if pending:
+                    pending.append(line)
+                    line = b"".join(pending)
+                    pending.clear()
+                await on_line(line.decode("utf-8", "replace"))
+                start = end + 1
+            if start < len(chunk):
+                pending.append(chunk[start:])
+        if pending:
+            await on_line(b"".join(pending).decode("utf-8", "replace"))
+        err = await err_task
+    finally:
+        err_task.cancel()
+    await proc.wait()
+    return bytes(out), err
+
+
+# (progress token, [notifications sent]) for the tool call running in this context
+_PROGRESS_STATE: ContextVar[tuple[Any, list[int]] | None] = ContextVar("_PROGRESS_STATE", default=None)
+
+
+def _progress_reporter() -> Callable[[str], Awaitable[None]] | None:
+    """Line callback forwarding output as MCP progress notifications, if the client asked for them."""
+    ctx = mcp.get_context()
+    try:
+        meta = ctx.request_context.meta
+    except ValueError:  # not inside a request
+        return None
+    token = meta.progressToken if meta is not None else None
+    if token is None:
+        return None
+    # one counter per request: composite tools run several commands under the same
+    # token, and progress must keep increasing across all of them
+    state = _PROGRESS_STATE.get()
+    if state is None or state[0] != token:
+        state = (token, [0])
+        _PROGRESS_STATE.set(state)
+    counter = state[1]
+
+    async def report(line: str) -> None:
+        if counter[0] < 0:  # an earlier notification failed; stop trying
+            return
+        counter[0] += 1
+        try:
+            await ctx.report_progress(counter[0], message=line)
+        except Exception:
+            # e.g. the client went away; progress is best-effort, the command keeps running
+            counter[0] = -1
+
+    return report
+
+
+def _stream_log_dir() -> str | None:
+    """Private directory for spooled output, pruned of logs past their retention."""
+    private = _private_tmp_dir()
+    if private is None:
+        return None
+    cutoff = time.time() - _STREAM_LOG_MAX_AGE
+    with os.scandir(private) as it:
+        for entry in it:
+            if entry.name.startswith("ansible_") and entry.name.endswith(".log"):
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    continue
+    return str(private)
+
+
+def _full_stdout(result: dict[str, Any]) -> str:
+    """Complete stdout of an _arun_cli result; spooled runs only carry a tail inline."""
+    path = result.get("stdout_path")
+    if path:
+        try:
+            with open(path, "rb") as f:
+                return f.read().decode("utf-8", "replace")
+        except OSError:
+            pass
+    return result.get("stdout", "")
+
+
+async def _arun_command_logged(command: list[str], cwd: Path | None = None, env: dict[str, str] | None = None) -> tuple[int, str, str, str, str]:
+    """Run a command with stdout/stderr written straight to log files.
+
+    Returns (rc, stdout_tail, stderr_tail, stdout_path, stderr_path).
+    """
+    merged_env = {**os.environ, **env} if env else None
+    log_dir = _stream_log_dir()
+    with tempfile.NamedTemporaryFile(prefix="ansible_", suffix=".stdout.log", dir=log_dir, delete=False) as out_f, \
+            tempfile.NamedTemporaryFile(prefix="ansible_", suffix=".stderr.log", dir=log_dir, delete=False) as err_f:
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=str(cwd) if cwd else None,
+            env=merged_env,
+            stdout=out_f,
+            stderr=err_f,
+            **_spawn_options(command, env, ()),
+        )
+        try:
+            rc = await proc.wait()
+        except asyncio.CancelledError:
+            proc.kill()
+            await proc.wait()
+            raise
+        out_tail = _read_tail(out_f.fileno(), _STREAM_TAIL_BYTES)
+        err_tail = _read_tail(err_f.fileno(), _STREAM_TAIL_BYTES)
+    return rc, out_tail, err_tail, out_f.name, err_f.name
+
+
+async def _arun_cli(command: list[str], cwd: Path | None, env: dict[str, str] | None, verbose: int | None) -> dict[str, Any]:
+    if verbose and verbose >= _STREAM_VERBOSITY:
+        rc, out, err, out_path, err_path = await _arun_command_logged(command, cwd=cwd, env=env)
+        return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(command), "command_argv": command, "stdout_path": out_path, "stderr_path": err_path}
+    # output stays in memory here because callers parse it (recap, facts); it is only
+    # mirrored to the client line by line when a progress token was supplied
+    rc, out, err = await _arun_command(command, cwd=cwd, env=env, on_line=_progress_reporter())
+    return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(command), "command_argv": command}
 
 
 def _serialize_playbook(playbook: Any) -> str:
     if isinstance(playbook, str):
         return playbook
-    return yaml.safe_dump(playbook, sort_keys=False)
+    try:
+        # tool arguments are plain JSON; its (key-order preserving) text is a cheap cache key
+        key = json.dumps(playbook)
+    except (TypeError, ValueError):
+        return yaml.dump(playbook, Dumper=_YDumper, sort_keys=False)
+    return _serialize_playbook_cached(key)
+
+
+@lru_cache(maxsize=256)
+def _serialize_playbook_cached(key: str) -> str:
+    return yaml.dump(json.loads(key), Dumper=_YDumper, sort_keys=False)
+
+
+def _private_tmp_dir() -> Path | None:
+    """Per-user 0700 directory under the system temp dir, or None if it can't be trusted."""
+    uid = os.getuid() if hasattr(os, "getuid") else None
+    path = Path(tempfile.gettempdir()) / f"mcp-ansible-{uid if uid is not None else 'user'}"
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        st = path.lstat()
+    except OSError:
+        return None
+    # refuse a symlink, or a directory someone else created or can write to
+    if not stat.S_ISDIR(st.st_mode) or (uid is not None and (st.st_uid != uid or st.st_mode & 0o077)):
+        return None
+    return path
 
 
-def _dict_to_module_args(module_args: dict[str, Any]) -> str:
+# same character class shlex.quote leaves unquoted
+_SAFE_SCALAR = re.compile(r"[\w@%+=:,./-]+", re.ASCII).fullmatch
+
+
+def _dict_to_module_args(module_args: dict[str, Any], _quote=shlex.quote, _dumps=_json_text, _safe=_SAFE_SCALAR) -> str:
+    # helpers are bound as defaults so the loop only touches locals; exact type()
+    # checks go first since MCP arguments arrive as plain JSON types
     parts: list[str] = []
+    append = parts.append
     for key, value in module_args.items():
-        if isinstance(value, (dict, list)):
-            parts.append(f"{key}={shlex.quote(json.dumps(value))}")
-        elif isinstance(value, bool):
-            parts.append(f"{key}={'yes' if value else 'no'}")
+        kind = type(value)
+        if kind is str:
+            text = value
+        elif kind is bool:
+            append(f"{key}={'yes' if value else 'no'}")
+            continue
         elif value is None:
-            parts.append(f"{key}=")
+            append(f"{key}=")
+            continue
+        elif kind is dict or kind is list or isinstance(value, (dict, list)):
+            append(f"{key}={_quote(_dumps(value))}")
+            continue
         else:
-            parts.append(f"{key}={shlex.quote(str(value))}")
+            text = str(value)
+        append(f"{key}={text}" if _safe(text) else f"{key}={_quote(text)}")
     return " ".join(parts)
 
 
@@ -66,47 +396,114 @@ def _dict_to_module_args(module_args: dict[str, Any]) -> str:
 
 CONFIG_ENV_VAR = "MCP_ANSIBLE_CONFIG"
 DEFAULT_CONFIG_FILE = Path.home() / ".config" / "mcp-ansible" / "config.json"
-LOCAL_CONFIG_FILE = Path.cwd() / "mcp_ansible.config.json"
+LOCAL_CONFIG_FILENAME = "mcp_ansible.config.json"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProjectDefinition:
+    # immutable and hashable so derived data (e.g. the subprocess env) can be memoized
     name: str
     root: str
     inventory: str | None = None
-    roles_paths: list[str] | None = None
-    collections_paths: list[str] | None = None
-    env: dict[str, str] | None = None
+    roles_paths: tuple[str, ...] | None = None
+    collections_paths: tuple[str, ...] | None = None
+    env: tuple[tuple[str, str], ...] | None = None
+
+
+def _freeze_env(env: dict[str, str] | None) -> tuple[tuple[str, str], ...] | None:
+    return tuple(sorted(env.items())) if env else None
+
+
+def _project_to_dict(defn: ProjectDefinition) -> dict[str, Any]:
+    # shallow, JSON-ready view; avoids the recursive deep copy done by dataclasses.asdict
+    return {
+        "name": defn.name,
+        "root": defn.root,
+        "inventory": defn.inventory,
+        "roles_paths": list(defn.roles_paths) if defn.roles_paths else None,
+        "collections_paths": list(defn.collections_paths) if defn.collections_paths else None,
+        "env": dict(defn.env) if defn.env else None,
+    }
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfiguration:
     projects: dict[str, ProjectDefinition]
     defaults: dict[str, Any]
 
 
-def _config_path() -> Path:
-    path = os.environ.get(CONFIG_ENV_VAR)
-    if path:
-        return Path(path).expanduser().resolve()
+@lru_cache(maxsize=1)
+def _config_path_cached(env_path: str | None, cwd: str) -> Path:
+    if env_path:
+        return Path(env_path).expanduser().resolve()
     # prefer local config if present, otherwise default user config
-    return LOCAL_CONFIG_FILE if LOCAL_CONFIG_FILE.exists() else DEFAULT_CONFIG_FILE
+    local = Path(cwd) / LOCAL_CONFIG_FILENAME
+    return local if local.exists() else DEFAULT_CONFIG_FILE
+
+
+def _config_path() -> Path:
+    # keyed on the inputs so a changed env var or working directory is picked up
+    return _config_path_cached(os.environ.get(CONFIG_ENV_VAR), os.getcwd())
 
 
 def _read_json(path: Path) -> dict[str, Any]:
     try:
-        return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        # a missing file lands in the except below; no separate exists() stat
+        return _json_loads(path.read_bytes())
     except Exception:
         return {}
 
 
 def _write_json(path: Path, data: dict[str, Any]) -> None:
-    _ensure_directory(path.parent)
-    path.write_text(json.dumps(data, indent=2, sort_keys=False), encoding="utf-8")
+    # resolve first so a symlinked config (e.g. managed from a dotfiles repo) is updated
+    # at its target instead of being replaced by a regular file
+    target = os.path.realpath(path)
+    _ensure_directory(Path(target).parent)
+    payload = memoryview(_json_dumps(data, indent=True))
+    try:
+        mode: int | None = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = None
+    # write a sibling of the target and rename it over it so readers never see a torn file
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        os.unlink(tmp)  # leftover from an interrupted write
+    except FileNotFoundError:
+        pass
+    # a new file gets the usual 0666 & ~umask; an existing one keeps its permissions
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600 if mode is not None else 0o666)
+    try:
+        if mode is not None:
+            os.fchmod(fd, mode)
+        while payload:
+            payload = payload[os.write(fd, payload):]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp)
+        raise
+    os.close(fd)
+    try:
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+# (path, st_mtime_ns, st_size, parsed config) of the last config file read or written
+_CONFIG_CACHE: tuple[Path, int, int, ServerConfiguration] | None = None
 
 
 def _load_config() -> ServerConfiguration:
+    global _CONFIG_CACHE
     path = _config_path()
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return ServerConfiguration(projects={}, defaults={})
+    cached = _CONFIG_CACHE
+    if cached is not None and cached[:3] == (path, st.st_mtime_ns, st.st_size):
+        return cached[3]
     raw = _read_json(path)
     projects_raw = raw.get("projects") or {}
     projects: dict[str, ProjectDefinition] = {}
@@ -115,25 +512,53 @@ def _load_config() -> ServerConfiguration:
             name=name,
             root=cfg.get("root", ""),
             inventory=cfg.get("inventory"),
-            roles_paths=list(cfg.get("roles_paths") or []) or None,
-            collections_paths=list(cfg.get("collections_paths") or []) or None,
-            env=dict(cfg.get("env") or {}) or None,
+            roles_paths=tuple(cfg.get("roles_paths") or ()) or None,
+            collections_paths=tuple(cfg.get("collections_paths") or ()) or None,
+            env=_freeze_env(dict(cfg.get("env") or {})),
         )
     defaults = dict(raw.get("defaults") or {})
-    return ServerConfiguration(projects=projects, defaults=defaults)
+    config = ServerConfiguration(projects=projects, defaults=defaults)
+    _CONFIG_CACHE = (path, st.st_mtime_ns, st.st_size, config)
+    return config
+
+
+# JSON-ready projects mapping of the config object it was built from; list-projects
+# hands it out as is until the file changes (new object) or _save_config replaces it
+_PROJECTS_VIEW: tuple[ServerConfiguration, dict[str, dict[str, Any]]] | None = None
+
+
+def _projects_view(config: ServerConfiguration) -> dict[str, dict[str, Any]]:
+    global _PROJECTS_VIEW
+    cached = _PROJECTS_VIEW
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    view = {name: _project_to_dict(defn) for name, defn in config.projects.items()}
+    _PROJECTS_VIEW = (config, view)
+    return view
 
 
 def _save_config(config: ServerConfiguration) -> dict[str, Any]:
+    global _CONFIG_CACHE, _PROJECTS_VIEW
+    # callers mutate config in place before saving, so any view of it is stale
+    _PROJECTS_VIEW = None
     path = _config_path()
-    payload = {
-        "projects": {name: asdict(defn) for name, defn in config.projects.items()},
-        "defaults": config.defaults,
-    }
-    _write_json(path, payload)
+    projects = {name: _project_to_dict(defn) for name, defn in config.projects.items()}
+    payload = {"projects": projects, "defaults": config.defaults}
+    try:
+        _write_json(path, payload)
+    except BaseException:
+        # the cached object may already carry the caller's unsaved changes
+        _CONFIG_CACHE = None
+        raise
+    st = path.stat()
+    _CONFIG_CACHE = (path, st.st_mtime_ns, st.st_size, config)
+    _PROJECTS_VIEW = (config, projects)
     return {"path": str(path), "projects": list(config.projects.keys())}
 
 
+@lru_cache(maxsize=128)
 def _project_env(defn: ProjectDefinition) -> dict[str, str]:
+    # memoized per (immutable) definition; callers must treat the result as read-only
     env: dict[str, str] = {}
     if defn.roles_paths:
         env["ANSIBLE_ROLES_PATH"] = os.pathsep.join(defn.roles_paths)
@@ -159,53 +584,185 @@ def _resolve_project(config: ServerConfiguration, name: str | None) -> ProjectDe
     return config.projects.get(str(project_name))
 
 
-def _discover_playbooks(root: Path) -> list[str]:
-    excluded_dirs = {".git", ".venv", "venv", "__pycache__", "collections", "inventory", "roles", "node_modules"}
-    results: list[str] = []
-    for dirpath, dirnames, filenames in os.walk(root):
-        # prune excluded directories
-        dirnames[:] = [d for d in dirnames if d not in excluded_dirs]
-        for filename in filenames:
-            if not (filename.endswith(".yml") or filename.endswith(".yaml")):
-                continue
-            path = Path(dirpath) / filename
-            try:
-                data = yaml.safe_load(path.read_text(encoding="utf-8"))
-                if isinstance(data, list):
-                    results.append(str(path))
-            except Exception:
-                # skip invalid YAML
+# Directory names never descended into during playbook discovery
+_EXCLUDED_DIRS = frozenset({".git", ".venv", "venv", "__pycache__", "collections", "inventory", "roles", "node_modules"})
+_YAML_SUFFIXES = (".yml", ".yaml")
+# Directory levels below the project root that discovery descends into
+_DISCOVERY_MAX_DEPTH = 8
+# Playbook verdicts by path: path -> (st_mtime_ns, st_size, is_playbook)
+_PLAYBOOK_CACHE: dict[str, tuple[int, int, bool]] = {}
+_PLAYBOOK_CACHE_MAX = 10_000
+
+
+def _looks_like_play_list(path: str) -> bool:
+    """Cheap pre-check: does the first YAML content line open a top-level sequence?"""
+    # one raw read of a single block is enough to classify almost every file
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        head = os.read(fd, 512)
+    finally:
+        os.close(fd)
+    if head.startswith(b"\xef\xbb\xbf"):
+        head = head[3:]
+    for line in head.splitlines():
+        stripped = line.lstrip()
+        # skip blank lines, comments, directives and document markers
+        if not stripped or stripped[:1] in (b"#", b"%") or stripped.startswith(b"..."):
+            continue
+        if stripped.startswith(b"---"):
+            stripped = stripped[3:].lstrip()
+            if not stripped or stripped[:1] == b"#":
                 continue
-    return sorted(results)
+        if stripped[:1] == b"[":
+            return True
+        return stripped[:1] == b"-" and stripped[1:2] in (b"", b" ", b"\t")
+    # header longer than the probe window; let the parser decide
+    return True
+
+
+def _is_playbook_file(path: str) -> bool:
+    try:
+        if not _looks_like_play_list(path):
+            return False
+        with open(path, "rb") as f:
+            # only the first document decides; anything after it is never parsed
+            for document in yaml.load_all(f, Loader=_YLoader):
+                return isinstance(document, list)
+        return False
+    except Exception:
+        # skip unreadable or invalid YAML
+        return False
+
+
+def _discover_playbooks(root: Path, exclude: Iterable[str] | None = None, max_depth: int = _DISCOVERY_MAX_DEPTH) -> list[str]:
+    patterns = list(exclude or [])
+    candidates: list[os.DirEntry[str]] = []
+    append = candidates.append
+
+    def _excluded(rel: str) -> bool:
+        return any(fnmatch.fnmatchcase(rel, pattern) for pattern in patterns)
+
+    # explicit DFS stack of (directory, path relative to root); DirEntry type checks
+    # come from readdir's d_type, so no per-entry stat is needed
+    stack: list[tuple[str, str, int]] = [(str(root), "", 0)]
+    push = stack.append
+    while stack:
+        dirpath, rel_dir, depth = stack.pop()
+        descend = depth < max_depth
+        try:
+            it = os.scandir(dirpath)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                if patterns and _excluded(rel):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    # prune excluded directories and anything past the depth limit before descending
+                    if descend and name not in _EXCLUDED_DIRS:
+                        push((entry.path, rel, depth + 1))
+                elif name.endswith(_YAML_SUFFIXES) and entry.is_file():
+                    append(entry)
+    # reuse verdicts for files whose (mtime, size) is unchanged since the last walk
+    found: list[str] = []
+    misses: list[tuple[str, int, int]] = []
+    cache = _PLAYBOOK_CACHE
+    for entry in candidates:
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        path = entry.path
+        cached = cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            if cached[2]:
+                found.append(path)
+        else:
+            misses.append((path, st.st_mtime_ns, st.st_size))
+    if len(misses) < 2:
+        verdicts = [_is_playbook_file(path) for path, _, _ in misses]
+    else:
+        # classification is read/parse bound; overlap it across a thread pool
+        workers = min(32, (os.cpu_count() or 4) * 4, len(misses))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            verdicts = list(pool.map(_is_playbook_file, [path for path, _, _ in misses]))
+    for (path, mtime_ns, size), ok in zip(misses, verdicts):
+        if path not in cache and len(cache) >= _PLAYBOOK_CACHE_MAX:
+            # FIFO eviction: dicts iterate in insertion order
+            del cache[next(iter(cache))]
+        cache[path] = (mtime_ns, size, ok)
+        if ok:
+            found.append(path)
+    return sorted(found)
+
+
+def _canonical_path(path: str) -> str:
+    # absolute paths without '..' only need lexical normalization; realpath would
+    # lstat() every component just to confirm what the caller already gave us
+    if os.path.isabs(path) and ".." not in path.split(os.sep):
+        return os.path.normpath(path)
+    return _realpath_cached(os.path.expanduser(path), os.getcwd())
+
+
+def _resolved_path(path: str) -> str:
+    # same result as str(Path(path).expanduser().resolve()); deliberately not memoized, so a
+    # repointed symlink (e.g. a /srv/app/current deploy link) is followed on the next call
+    return os.path.realpath(os.path.expanduser(path))
 
 
-def _split_paths(value: str | None) -> list[str] | None:
+@lru_cache(maxsize=1024)
+def _realpath_cached(path: str, cwd: str) -> str:
+    # keyed on the working directory too, since relative inputs resolve against it
+    return os.path.realpath(os.path.join(cwd, path))
+
+
+def _split_paths(value: str | None) -> tuple[str, ...] | None:
     if not value:
         return None
-    parts = [p for p in value.split(os.pathsep) if p]
-    return [str(Path(p).expanduser().resolve()) for p in parts] or None
+    # abspath is purely lexical; these only end up in ANSIBLE_*_PATH for the subprocess
+    return tuple(os.path.abspath(os.path.expanduser(p)) for p in value.split(os.pathsep) if p) or None
+
+
+_ENV_PREFIX = "MCP_ANSIBLE_ENV_"
 
 
 def _project_from_env() -> ProjectDefinition | None:
-    root = os.environ.get("MCP_ANSIBLE_PROJECT_ROOT")
+    environ = os.environ
+    root = environ.get("MCP_ANSIBLE_PROJECT_ROOT")
     if not root:
         return None
-    name = os.environ.get("MCP_ANSIBLE_PROJECT_NAME", "env")
-    inventory = os.environ.get("MCP_ANSIBLE_INVENTORY")
-    roles_paths = _split_paths(os.environ.get("MCP_ANSIBLE_ROLES_PATH"))
-    collections_paths = _split_paths(os.environ.get("MCP_ANSIBLE_COLLECTIONS_PATHS"))
-    # Capture any extra env with MCP_ANSIBLE_ENV_* prefix
-    extra_env: dict[str, str] = {}
-    for key, value in os.environ.items():
-        if key.startswith("MCP_ANSIBLE_ENV_"):
-            extra_env[key.replace("MCP_ANSIBLE_ENV_", "")] = value
+    # Capture any extra env with MCP_ANSIBLE_ENV_* prefix; the same single pass
+    # doubles as the cache key, so path resolution only reruns when the env changes
+    cut = len(_ENV_PREFIX)
+    extra_env = tuple(sorted((k[cut:], v) for k, v in environ.items() if k.startswith(_ENV_PREFIX)))
+    return _project_from_env_cached(
+        root,
+        environ.get("MCP_ANSIBLE_PROJECT_NAME", "env"),
+        environ.get("MCP_ANSIBLE_INVENTORY"),
+        environ.get("MCP_ANSIBLE_ROLES_PATH"),
+        environ.get("MCP_ANSIBLE_COLLECTIONS_PATHS"),
+        extra_env or None,
+    )
+
+
+@lru_cache(maxsize=8)
+def _project_from_env_cached(
+    root: str,
+    name: str,
+    inventory: str | None,
+    roles_path: str | None,
+    collections_paths: str | None,
+    env: tuple[tuple[str, str], ...] | None,
+) -> ProjectDefinition:
     return ProjectDefinition(
         name=name,
-        root=str(Path(root).expanduser().resolve()),
-        inventory=str(Path(inventory).expanduser().resolve()) if inventory else None,
-        roles_paths=roles_paths,
-        collections_paths=collections_paths,
-        env=extra_env or None,
+        root=os.path.realpath(os.path.expanduser(root)),
+        inventory=os.path.realpath(os.path.expanduser(inventory)) if inventory else None,
+        roles_paths=_split_paths(roles_path),
+        collections_paths=_split_paths(collections_paths),
+        env=env,
     )
 
 
@@ -222,12 +779,9 @@ def _extract_hosts_from_inventory_json(data: dict[str, Any]) -> tuple[set[str],
             continue
         if isinstance(group_def, dict):
             group_hosts = group_def.get("hosts") or []
-            if isinstance(group_hosts, list):
-                for h in group_hosts:
-                    if isinstance(h, str):
-                        hosts.add(h)
-                if group_hosts:
-                    groups[group_name] = [str(h) for h in group_hosts]
+            if isinstance(group_hosts, list) and group_hosts:
+                hosts.update(h for h in group_hosts if type(h) is str)
+                groups[group_name] = list(map(str, group_hosts))
     return hosts, groups
 
 
@@ -251,7 +805,7 @@ def ansible_inventory(inventory: str | None = None, include_hostvars: bool | Non
         result["stdout"] = out
         return result
     try:
-        data = json.loads(out)
+        data = _json_loads(out)
     except Exception:
         result["stdout"] = out
         return result
@@ -272,8 +826,8 @@ def ansible_inventory(inventory: str | None = None, include_hostvars: bool | Non
 def _compose_ansible_env(ansible_cfg_path: str | None = None, project_root: str | None = None, extra_env: dict[str, str] | None = None) -> tuple[dict[str, str], Path | None]:
     env: dict[str, str] = {}
     if ansible_cfg_path:
-        env["ANSIBLE_CONFIG"] = str(Path(ansible_cfg_path).expanduser().resolve())
-    cwd: Path | None = Path(project_root).expanduser().resolve() if project_root else None
+        env["ANSIBLE_CONFIG"] = _resolved_path(ansible_cfg_path)
+    cwd: Path | None = Path(_resolved_path(project_root)) if project_root else None
     if extra_env:
         env.update(extra_env)
     return env, cwd
@@ -282,41 +836,143 @@ def _compose_ansible_env(ansible_cfg_path: str | None = None, project_root: str
 def _inventory_cli(inventory_paths: list[str] | None) -> list[str]:
     if not inventory_paths:
         return []
-    joined = ",".join(str(Path(p).expanduser().resolve()) for p in inventory_paths)
+    joined = ",".join(map(_resolved_path, inventory_paths))
     return ["-i", joined]
 
 
+# Successful inventory-parse results: key -> (expires_at, fingerprint, result).
+# The fingerprint catches edits to the inventory sources; the TTL bounds staleness
+# for dynamic inventories whose output changes without any file changing.
+_INV_CACHE: dict[tuple, tuple[float, tuple, dict[str, Any]]] = {}
+_INV_CACHE_TTL = 60.0
+_INV_CACHE_MAX = 32
+# inventory-diff parses both sides on worker threads
+_INV_CACHE_LOCK = threading.Lock()
+
+
+def _tree_mtime(path: str, prune: frozenset[str] = frozenset()) -> int:
+    """Newest mtime_ns of a file, or of a directory and everything below it (-1 if missing).
+
+    Subdirectories named in ``prune`` are neither stat'ed nor descended into.
+    """
+    try:
+        latest = os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+    stack = [path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:  # plain file, or unreadable directory
+            continue
+        with it:
+            for entry in it:
+                if entry.name in prune:
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                if mtime > latest:
+                    latest = mtime
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return latest
+
+
+def _ansible_cfg_file(base: str, env: dict[str, str] | None) -> str | None:
+    """The ansible.cfg ansible would load when run from ``base``, in its search order."""
+    cfg_file = (env and env.get("ANSIBLE_CONFIG")) or os.environ.get("ANSIBLE_CONFIG")
+    if cfg_file:
+        return cfg_file
+    for candidate in (os.path.join(base, "ansible.cfg"), os.path.expanduser("~/.ansible.cfg"), "/etc/ansible/ansible.cfg"):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _inventory_sources(cwd: Path | None, env: dict[str, str], inventory_paths: list[str] | None) -> tuple[str | None, list[str]]:
+    """Best-effort (ansible.cfg, inventory sources) that ansible-inventory will read."""
+    base = str(cwd) if cwd else os.getcwd()
+    cfg_file = _ansible_cfg_file(base, env)
+    if inventory_paths:
+        return cfg_file, list(map(_resolved_path, inventory_paths))
+    configured = os.environ.get("ANSIBLE_INVENTORY")
+    rel_base = base
+    if not configured and cfg_file:
+        parser = configparser.ConfigParser(interpolation=None)
+        try:
+            parser.read(cfg_file, encoding="utf-8")
+        except (configparser.Error, UnicodeDecodeError):
+            pass
+        configured = parser.get("defaults", "inventory", fallback=None)
+        rel_base = os.path.dirname(cfg_file)
+    if not configured:
+        return cfg_file, ["/etc/ansible/hosts"]
+    return cfg_file, [os.path.join(rel_base, os.path.expanduser(p.strip())) for p in configured.split(",") if p.strip()]
+
+
+def _inventory_fingerprint(cfg_file: str | None, sources: list[str]) -> tuple:
+    paths = [cfg_file] if cfg_file else []
+    for src in sources:
+        paths.append(src)
+        if not os.path.isdir(src):
+            # group_vars/host_vars next to an inventory file are merged in as well
+            parent = os.path.dirname(src)
+            paths.append(os.path.join(parent, "group_vars"))
+            paths.append(os.path.join(parent, "host_vars"))
+    return tuple((p, _tree_mtime(p)) for p in paths)
+
+
 @mcp.tool(name="inventory-parse")
-def inventory_parse(project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, include_hostvars: bool | None = None, deep: bool | None = None) -> dict[str, Any]:
+def inventory_parse(project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, include_hostvars: bool | None = None, deep: bool | None = None, refresh: bool | None = None) -> dict[str, Any]:
     """Parse inventory via ansible-inventory, merging group_vars/host_vars.
 
+    Successful results are cached until an inventory source, its group_vars/host_vars,
+    or the active ansible.cfg changes (or for at most a minute, for dynamic inventories).
+
     Args:
         project_root: Project root folder (sets CWD and uses ansible.cfg if present)
         ansible_cfg_path: Explicit ansible.cfg path (overrides)
         inventory_paths: Optional list of inventory files/dirs (ini/yaml/no-ext supported)
         include_hostvars: Include merged hostvars in response
         deep: Placeholder for future source mapping; ignored for now
+        refresh: Bypass the cache and re-run ansible-inventory
     """
     extra_env = {"INVENTORY_ENABLED": "auto"}
     env, cwd = _compose_ansible_env(ansible_cfg_path, project_root, extra_env)
     cmd: list[str] = ["ansible-inventory", "--list"] + _inventory_cli(inventory_paths)
-    rc, out, err = _run_command(cmd, cwd=cwd, env=env)
-    result: dict[str, Any] = {"ok": rc == 0, "rc": rc, "stderr": err, "command": shlex.join(cmd), "cwd": str(cwd) if cwd else None}
-    if rc != 0:
-        result["stdout"] = out
-        return result
-    try:
-        data = json.loads(out)
-    except Exception:
-        result["stdout"] = out
-        return result
-    hosts, groups = _extract_hosts_from_inventory_json(data)
-    result["hosts"] = sorted(hosts)
-    result["groups"] = {k: sorted(v) for k, v in groups.items()}
-    if include_hostvars:
+    key = (str(cwd) if cwd else os.getcwd(), env.get("ANSIBLE_CONFIG"), os.environ.get("ANSIBLE_INVENTORY"), tuple(cmd))
+    fingerprint = _inventory_fingerprint(*_inventory_sources(cwd, env, inventory_paths))
+    with _INV_CACHE_LOCK:
+        cached = None if refresh else _INV_CACHE.get(key)
+    if cached is not None and cached[0] > time.monotonic() and cached[1] == fingerprint:
+        result = dict(cached[2])
+    else:
+        rc, out, err = _run_command(cmd, cwd=cwd, env=env)
+        result = {"ok": rc == 0, "rc": rc, "stderr": err, "command": shlex.join(cmd), "cwd": str(cwd) if cwd else None}
+        if rc != 0:
+            result["stdout"] = out
+            return result
+        try:
+            data = _json_loads(out)
+        except Exception:
+            result["stdout"] = out
+            return result
+        hosts, groups = _extract_hosts_from_inventory_json(data)
+        result["hosts"] = sorted(hosts)
+        result["groups"] = {k: sorted(v) for k, v in groups.items()}
         meta = data.get("_meta") or {}
-        hostvars = meta.get("hostvars") or {}
-        result["hostvars"] = hostvars
+        result["hostvars"] = meta.get("hostvars") or {}
+        with _INV_CACHE_LOCK:
+            _INV_CACHE.pop(key, None)
+            if len(_INV_CACHE) >= _INV_CACHE_MAX:
+                # evict the oldest entry (dicts keep insertion order)
+                _INV_CACHE.pop(next(iter(_INV_CACHE)), None)
+            _INV_CACHE[key] = (time.monotonic() + _INV_CACHE_TTL, fingerprint, result)
+        result = dict(result)
+    if not include_hostvars:
+        del result["hostvars"]
     return result
 
 
@@ -337,22 +993,26 @@ def inventory_find_host(host: str, project_root: str | None = None, ansible_cfg_
         return parsed
     all_groups: dict[str, list[str]] = parsed.get("groups", {})
     hostvars: dict[str, Any] = parsed.get("hostvars", {})
-    groups_for_host = sorted([g for g, members in all_groups.items() if host in set(members)])
+    # reverse index, built in one pass over the membership lists
+    host_to_groups: dict[str, list[str]] = {}
+    for g, members in all_groups.items():
+        for h in members:
+            host_to_groups.setdefault(h, []).append(g)
     return {
         "ok": True,
         "host": host,
-        "present": host in hostvars or any(host in members for members in all_groups.values()),
-        "groups": groups_for_host,
+        "present": host in hostvars or host in host_to_groups,
+        "groups": sorted(host_to_groups.get(host, [])),
         "hostvars": hostvars.get(host, {}),
     }
 
 
 @mcp.tool(name="ansible-ping")
-def ansible_ping(host_pattern: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, verbose: int | None = None) -> dict[str, Any]:
+async def ansible_ping(host_pattern: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, verbose: int | None = None) -> dict[str, Any]:
     """Ping hosts using the Ansible ad-hoc ping module."""
     env, cwd = _compose_ansible_env(ansible_cfg_path, project_root, None)
     inventory_str = ",".join(inventory_paths) if inventory_paths else None
-    return ansible_task(
+    return await ansible_task(
         host_pattern=host_pattern,
         module="ping",
         args=None,
@@ -363,22 +1023,28 @@ def ansible_ping(host_pattern: str, project_root: str | None = None, ansible_cfg
     )
 
 
+# "host | SUCCESS => {...}": pretty-printed JSON closes with "}" at column 0, the
+# one-line form on the header line itself
+_SUCCESS_JSON_RE = re.compile(r"^(\S+) \| SUCCESS => (\{\n.*?\n\}|\{[^\n]*\})$", re.M | re.S)
+
+
+def _iter_success_json(stdout: str) -> Iterable[tuple[str, Any]]:
+    for match in _SUCCESS_JSON_RE.finditer(stdout):
+        try:
+            yield match.group(1), _json_loads(match.group(2))
+        except ValueError:
+            continue
+
+
 def _parse_setup_stdout(stdout: str) -> dict[str, Any]:
     facts: dict[str, Any] = {}
-    for line in stdout.splitlines():
-        if "SUCCESS" in line and "=>" in line:
-            try:
-                left, right = line.split("=>", 1)
-                host = left.split("|")[0].strip()
-                data = json.loads(right.strip())
-                facts[host] = data.get("ansible_facts") or data
-            except Exception:
-                continue
+    for host, data in _iter_success_json(stdout):
+        facts[host] = (data.get("ansible_facts") or data) if isinstance(data, dict) else data
     return facts
 
 
 @mcp.tool(name="ansible-gather-facts")
-def ansible_gather_facts(host_pattern: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, filter: str | None = None, gather_subset: str | None = None, verbose: int | None = None) -> dict[str, Any]:
+async def ansible_gather_facts(host_pattern: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, filter: str | None = None, gather_subset: str | None = None, verbose: int | None = None) -> dict[str, Any]:
     """Gather facts using the setup module and return parsed per-host facts."""
     env, cwd = _compose_ansible_env(ansible_cfg_path, project_root, {"ANSIBLE_STDOUT_CALLBACK": "default"})
     args: dict[str, Any] = {}
@@ -387,7 +1053,7 @@ def ansible_gather_facts(host_pattern: str, project_root: str | None = None, ans
     if gather_subset:
         args["gather_subset"] = gather_subset
     inventory_str = ",".join(inventory_paths) if inventory_paths else None
-    res = ansible_task(
+    res = await ansible_task(
         host_pattern=host_pattern,
         module="setup",
         args=args or None,
@@ -396,37 +1062,54 @@ def ansible_gather_facts(host_pattern: str, project_root: str | None = None, ans
         verbose=verbose,
         env=env,
     )
-    facts = _parse_setup_stdout(res.get("stdout", ""))
+    facts = _parse_setup_stdout(_full_stdout(res))
     res["facts"] = facts
     return res
 
 
+@lru_cache(maxsize=1024)
+def _yaml_parse_error(path: str, mtime_ns: int, size: int) -> dict[str, Any] | None:
+    """Parse error for ``path`` at a given stat signature, or None if it loads cleanly."""
+    try:
+        # binary mode: libyaml detects and decodes the encoding itself
+        with open(path, "rb") as f:
+            yaml.load(f, Loader=_YLoader)
+    except yaml.YAMLError as e:  # type: ignore[attr-defined]
+        info: dict[str, Any] = {"message": str(e)}
+        if hasattr(e, "problem_mark") and e.problem_mark is not None:  # type: ignore[attr-defined]
+            mark = e.problem_mark
+            info.update({"line": getattr(mark, "line", None), "column": getattr(mark, "column", None)})
+        return info
+    return None
+
+
+def _validate_one(path: str) -> dict[str, Any]:
+    entry: dict[str, Any] = {"path": path}
+    try:
+        st = os.stat(path)
+        error = _yaml_parse_error(path, st.st_mtime_ns, st.st_size)
+    except Exception as e:
+        error = {"message": str(e)}
+    entry["ok"] = error is None
+    if error is not None:
+        entry["error"] = dict(error)
+    return entry
+
+
 @mcp.tool(name="validate-yaml")
 def validate_yaml(paths: list[str] | str) -> dict[str, Any]:
-    """Validate YAML files; return parse errors with line/column if any."""
-    path_list = [paths] if isinstance(paths, str) else list(paths)
-    results: list[dict[str, Any]] = []
-    ok_all = True
-    for p in path_list:
-        entry: dict[str, Any] = {"path": str(p)}
-        try:
-            with open(p, "r", encoding="utf-8") as f:
-                yaml.safe_load(f)
-            entry["ok"] = True
-        except yaml.YAMLError as e:  # type: ignore[attr-defined]
-            ok_all = False
-            info: dict[str, Any] = {"message": str(e)}
-            if hasattr(e, "problem_mark") and e.problem_mark is not None:  # type: ignore[attr-defined]
-                mark = e.problem_mark
-                info.update({"line": getattr(mark, "line", None), "column": getattr(mark, "column", None)})
-            entry["ok"] = False
-            entry["error"] = info
-        except Exception as e:
-            ok_all = False
-            entry["ok"] = False
-            entry["error"] = {"message": str(e)}
-        results.append(entry)
-    return {"ok": ok_all, "results": results}
+    """Validate YAML files; return parse errors with line/column if any.
+
+    Results are cached per file until its mtime or size changes.
+    """
+    path_list = [str(paths)] if isinstance(paths, str) else [str(p) for p in paths]
+    if len(path_list) < 2:
+        results = [_validate_one(p) for p in path_list]
+    else:
+        workers = min(32, (os.cpu_count() or 4) * 4, len(path_list))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_validate_one, path_list))
+    return {"ok": all(r["ok"] for r in results), "results": results}
 
 
 def _exists(path: Path) -> bool:
@@ -468,9 +1151,25 @@ def galaxy_install(project_root: str, force: bool | None = None, requirements_pa
     executed: list[dict[str, Any]] = []
     if not reqs:
         return {"ok": True, "executed": [], "note": "No requirements.yml found"}
+    # a file listed in requirements_paths may already have been discovered; install it once per kind
+    unique: dict[tuple[str, str], tuple[str, str, list[str]]] = {}
+    for req in reqs:
+        unique.setdefault((req[0], os.path.realpath(req[1])), req)
+    reqs = list(unique.values())
+    # ansible-galaxy takes a single -r per run, so files can't be merged into one call; role
+    # and collection installs write to separate trees, though, so run the two queues side by side
+    results: list[tuple[int, str, str]] = [(0, "", "")] * len(reqs)
+
+    def _run_queue(indices: list[int]) -> None:
+        for i in indices:
+            results[i] = _run_command(reqs[i][2], cwd=cwd, env=env)
+
+    queues = [q for q in ([i for i, r in enumerate(reqs) if r[0] == kind] for kind in ("role", "collection")) if q]
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        for future in [pool.submit(_run_queue, q) for q in queues]:
+            future.result()
     ok_all = True
-    for kind, path, cmd in reqs:
-        rc, out, err = _run_command(cmd, cwd=cwd, env=env)
+    for (kind, path, cmd), (rc, out, err) in zip(reqs, results):
         executed.append({"kind": kind, "requirements": path, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(cmd)})
         if rc != 0:
             ok_all = False
@@ -499,30 +1198,22 @@ def project_bootstrap(project_root: str) -> dict[str, Any]:
 # -------------------------
 
 
+_RECAP_KEYS = ("ok", "changed", "unreachable", "failed", "skipped", "rescued", "ignored")
+_RECAP_LINE_RE = re.compile(r"^[ \t]*(\S+)[ \t]*:[ \t]*(\w+=\d+(?:[ \t]+\w+=\d+)*)[ \t]*$", re.M)
+_RECAP_STAT_RE = re.compile(r"(\w+)=(\d+)")
+
+
 def _parse_play_recap(stdout: str) -> dict[str, dict[str, int]]:
     totals: dict[str, dict[str, int]] = {}
-    started = False
-    for line in stdout.splitlines():
-        if line.strip().startswith("PLAY RECAP"):
-            started = True
-            continue
-        if started:
-            if not line.strip():
-                continue
-            parts = line.split(":", 1)
-            if len(parts) != 2:
-                continue
-            host = parts[0].strip()
-            stats = {k: 0 for k in ["ok", "changed", "unreachable", "failed", "skipped", "rescued", "ignored"]}
-            for seg in parts[1].split():
-                if "=" in seg:
-                    k, v = seg.split("=", 1)
-                    if k in stats:
-                        try:
-                            stats[k] = int(v)
-                        except ValueError:
-                            pass
-            totals[host] = stats
+    start = stdout.find("PLAY RECAP")
+    if start < 0:
+        return totals
+    for match in _RECAP_LINE_RE.finditer(stdout, start):
+        stats = dict.fromkeys(_RECAP_KEYS, 0)
+        for k, v in _RECAP_STAT_RE.findall(match.group(2)):
+            if k in stats:
+                stats[k] = int(v)
+        totals[match.group(1)] = stats
     return totals
 
 
@@ -539,10 +1230,14 @@ def inventory_diff(left_project_root: str | None = None, left_ansible_cfg_path:
       - added_groups, removed_groups, group_membership_changes
       - hostvars_key_changes (if include_hostvars)
     """
-    left = inventory_parse(project_root=left_project_root, ansible_cfg_path=left_ansible_cfg_path, inventory_paths=left_inventory_paths, include_hostvars=include_hostvars)
+    # the two ansible-inventory runs are independent; overlap them
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        left_future = pool.submit(inventory_parse, project_root=left_project_root, ansible_cfg_path=left_ansible_cfg_path, inventory_paths=left_inventory_paths, include_hostvars=include_hostvars)
+        right_future = pool.submit(inventory_parse, project_root=right_project_root, ansible_cfg_path=right_ansible_cfg_path, inventory_paths=right_inventory_paths, include_hostvars=include_hostvars)
+        left = left_future.result()
+        right = right_future.result()
     if not left.get("ok"):
         return {"ok": False, "side": "left", "error": left}
-    right = inventory_parse(project_root=right_project_root, ansible_cfg_path=right_ansible_cfg_path, inventory_paths=right_inventory_paths, include_hostvars=include_hostvars)
     if not right.get("ok"):
         return {"ok": False, "side": "right", "error": right}
     left_hosts = set(left.get("hosts", []))
@@ -585,16 +1280,16 @@ def inventory_diff(left_project_root: str | None = None, left_ansible_cfg_path:
 
 
 @mcp.tool(name="ansible-test-idempotence")
-def ansible_test_idempotence(playbook_path: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, extra_vars: dict[str, Any] | None = None, verbose: int | None = None) -> dict[str, Any]:
+async def ansible_test_idempotence(playbook_path: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, extra_vars: dict[str, Any] | None = None, verbose: int | None = None) -> dict[str, Any]:
     """Run a playbook twice and ensure no changes on the second run. Returns recap and pass/fail."""
     env, cwd = _compose_ansible_env(ansible_cfg_path, project_root, None)
     inventory_str = ",".join(inventory_paths) if inventory_paths else None
     # First apply
-    first = ansible_playbook(playbook_path=playbook_path, inventory=inventory_str, extra_vars=extra_vars, cwd=str(cwd) if cwd else None, verbose=verbose, env=env)
-    first_recap = _parse_play_recap(first.get("stdout", ""))
+    first = await ansible_playbook(playbook_path=playbook_path, inventory=inventory_str, extra_vars=extra_vars, cwd=str(cwd) if cwd else None, verbose=verbose, env=env)
+    first_recap = _parse_play_recap(_full_stdout(first))
     # Second apply
-    second = ansible_playbook(playbook_path=playbook_path, inventory=inventory_str, extra_vars=extra_vars, cwd=str(cwd) if cwd else None, verbose=verbose, env=env)
-    second_recap = _parse_play_recap(second.get("stdout", ""))
+    second = await ansible_playbook(playbook_path=playbook_path, inventory=inventory_str, extra_vars=extra_vars, cwd=str(cwd) if cwd else None, verbose=verbose, env=env)
+    second_recap = _parse_play_recap(_full_stdout(second))
     changed_total = _sum_changed(second_recap)
     return {
         "ok": first.get("ok", False) and second.get("ok", False) and changed_total == 0,
@@ -618,7 +1313,7 @@ def galaxy_lock(project_root: str, output_path: str | None = None) -> dict[str,
     collections: list[dict[str, str]] = []
     if rc_c == 0:
         try:
-            data = json.loads(out_c)
+            data = _json_loads(out_c)
             for name, info in data.items():
                 version = str(info.get("version")) if isinstance(info, dict) else None
                 if version:
@@ -645,20 +1340,59 @@ def galaxy_lock(project_root: str, output_path: str | None = None) -> dict[str,
                 if len(parts) >= 2:
                     roles.append({"name": parts[0], "version": parts[1].lstrip("v ")})
     lock = {"collections": sorted(collections, key=lambda x: x["name"]), "roles": sorted(roles, key=lambda x: x["name"]) }
-    text = yaml.safe_dump(lock, sort_keys=False)
     path = Path(output_path).expanduser().resolve() if output_path else (root / "requirements.lock.yml")
-    path.write_text(text, encoding="utf-8")
+    # let the emitter encode straight to bytes; no intermediate str round-trip
+    path.write_bytes(yaml.dump(lock, Dumper=_YDumper, sort_keys=False, encoding="utf-8"))
     return {"ok": True, "path": str(path), "collections": len(collections), "roles": len(roles)}
 
 
+# largest secret handed over through a pipe; smallest default pipe capacity (macOS) is 16 KiB
+_VAULT_PIPE_MAX = 4096
+
+
 @contextmanager
-def _vault_password_file(password: str):
+def _vault_password_file(password: str, in_memory: bool = True):
+    """Yield (path, fds) for a file holding ``password``; ``fds`` must be passed to the child.
+
+    On Linux the secret lives in an anonymous memfd the child opens via /proc/self/fd/N,
+    so it never touches disk. Without memfd_create (e.g. macOS) a pipe read end is handed
+    over as /dev/fd/N instead. When the consuming option resolves symlinks
+    (``in_memory=False``) it falls back to a temp file removed afterwards.
+    """
+    data = password.encode("utf-8")
+    fd = -1
+    if in_memory and hasattr(os, "memfd_create") and os.path.isdir("/proc/self/fd"):
+        try:
+            fd = os.memfd_create("vault", os.MFD_CLOEXEC)
+        except OSError:
+            fd = -1
+    if fd >= 0:
+        try:
+            # memfds are created 0777, and ansible runs executable password files as scripts
+            os.fchmod(fd, 0o600)
+            os.write(fd, data)
+            yield f"/proc/self/fd/{fd}", (fd,)
+        finally:
+            os.close(fd)
+        return
+    # the whole secret is written before the child starts, so it must fit the pipe buffer
+    if in_memory and len(data) < _VAULT_PIPE_MAX and os.path.isdir("/dev/fd"):
+        r, w = os.pipe()
+        try:
+            os.write(w, data)
+        finally:
+            os.close(w)
+        try:
+            yield f"/dev/fd/{r}", (r,)
+        finally:
+            os.close(r)
+        return
     tf = tempfile.NamedTemporaryFile(prefix="vault_", suffix=".pwd", delete=False)
     try:
-        tf.write(password.encode("utf-8"))
+        tf.write(data)
         tf.flush()
         tf.close()
-        yield tf.name
+        yield tf.name, ()
     finally:
         try:
             os.remove(tf.name)
@@ -684,13 +1418,14 @@ def _run_vault_cmd(subcmd: list[str], project_root: str | None, password: str |
     env, cwd = _compose_ansible_env(None, project_root, None)
     args, inline_pw = _resolve_vault_pw_args(password, password_file)
     if inline_pw is None:
-        rc, out, err = _run_command(["ansible-vault", *subcmd, *args], cwd=cwd, env=env)
-        return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(["ansible-vault", *subcmd, *args])}
+        cmd = ["ansible-vault", *subcmd, *args]
+        rc, out, err = _run_command(cmd, cwd=cwd, env=env)
+        return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(cmd), "command_argv": cmd}
     else:
-        with _vault_password_file(inline_pw) as pwfile:
-            vault_args = [a if a != "__TEMPFILE__" else pwfile for a in args]
-            rc, out, err = _run_command(["ansible-vault", *subcmd, *vault_args], cwd=cwd, env=env)
-            return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(["ansible-vault", *subcmd, *vault_args])}
+        with _vault_password_file(inline_pw) as (pwfile, fds):
+            cmd = ["ansible-vault", *subcmd, *[a if a != "__TEMPFILE__" else pwfile for a in args]]
+            rc, out, err = _run_command(cmd, cwd=cwd, env=env, pass_fds=fds)
+            return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(cmd), "command_argv": cmd}
 
 
 @mcp.tool(name="vault-encrypt")
@@ -706,31 +1441,52 @@ def vault_decrypt(file_paths: list[str] | str, project_root: str | None = None,
 
 
 @mcp.tool(name="vault-view")
-def vault_view(file_path: str, project_root: str | None = None, password: str | None = None, password_file: str | None = None) -> dict[str, Any]:
-    return _run_vault_cmd(["view", file_path], project_root, password, password_file)
+def vault_view(file_path: list[str] | str, project_root: str | None = None, password: str | None = None, password_file: str | None = None) -> dict[str, Any]:
+    if isinstance(file_path, str):
+        return _run_vault_cmd(["view", file_path], project_root, password, password_file)
+    # one call per file: ansible-vault prints several plaintexts back to back with no
+    # separator, so a batched call couldn't be split per file
+    files: dict[str, str] = {}
+    errors: dict[str, str] = {}
+    for path in file_path:
+        res = _run_vault_cmd(["view", path], project_root, password, password_file)
+        if res["ok"]:
+            files[path] = res["stdout"]
+        else:
+            errors[path] = res["stderr"]
+    return {"ok": not errors, "files": files, "errors": errors}
 
 
 @mcp.tool(name="vault-rekey")
-def vault_rekey(file_paths: list[str] | str, project_root: str | None = None, old_password: str | None = None, old_password_file: str | None = None, new_password: str | None = None, new_password_file: str | None = None) -> dict[str, Any]:
+async def vault_rekey(file_paths: list[str] | str, project_root: str | None = None, old_password: str | None = None, old_password_file: str | None = None, new_password: str | None = None, new_password_file: str | None = None) -> dict[str, Any]:
     files = [file_paths] if isinstance(file_paths, str) else list(file_paths)
     # First provide old password
     old_args, inline_old = _resolve_vault_pw_args(old_password, old_password_file)
     # New password via env: ANSIBLE_VAULT_NEW_PASSWORD_FILE not supported CLI; use --new-vault-password-file
     new_args, inline_new = _resolve_vault_pw_args(new_password, new_password_file)
-    # Combine
-    subcmd = ["rekey", *files, *(["--new-vault-password-file", "__TEMPFILE_NEW__"] if (inline_new or new_password_file) else []), *old_args]
+    # Build once; the password file slots are remembered by index and filled in below
+    cmd = ["ansible-vault", "rekey", *files]
+    new_idx = old_idx = -1
+    if inline_new or new_password_file:
+        cmd.append("--new-vault-password-file")
+        new_idx = len(cmd)
+        cmd.append(new_args[1] if new_password_file else "__TEMPFILE_NEW__")
+    if old_args:
+        cmd.extend(old_args)
+        old_idx = len(cmd) - 1
     env, cwd = _compose_ansible_env(None, project_root, None)
     if inline_old or inline_new:
-        with _vault_password_file(inline_old or "") as oldf, _vault_password_file(inline_new or "") as newf:
-            cmd = ["ansible-vault", *([c if c != "__TEMPFILE_NEW__" else newf for c in subcmd])]
-            # Replace placeholder in old_args
-            cmd = [a if a != "__TEMPFILE__" else oldf for a in cmd]
-            rc, out, err = _run_command(cmd, cwd=cwd, env=env)
-            return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(cmd)}
+        # --new-vault-password-file is realpath'd by ansible-vault, which breaks /proc/self/fd links
+        with _vault_password_file(inline_old or "") as (oldf, old_fds), _vault_password_file(inline_new or "", in_memory=False) as (newf, new_fds):
+            if inline_new:
+                cmd[new_idx] = newf
+            if inline_old:
+                cmd[old_idx] = oldf
+            rc, out, err = await _arun_command(cmd, cwd=cwd, env=env, pass_fds=old_fds + new_fds)
+            return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(cmd), "command_argv": cmd}
     # No inline passwords, just use provided files
-    cmd = ["ansible-vault", *([c if c != "__TEMPFILE_NEW__" else (new_args[1] if new_args else "") for c in subcmd])]
-    rc, out, err = _run_command(cmd, cwd=cwd, env=env)
-    return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(cmd)}
+    rc, out, err = await _arun_command(cmd, cwd=cwd, env=env)
+    return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(cmd), "command_argv": cmd}
 
 
 @mcp.tool(name="register-project")
@@ -751,11 +1507,11 @@ def register_project(name: str, root: str, inventory: str | None = None, roles_p
     cfg = _load_config()
     cfg.projects[name] = ProjectDefinition(
         name=name,
-        root=str(Path(root).resolve()),
-        inventory=str(Path(inventory).resolve()) if inventory else None,
-        roles_paths=[str(Path(p).resolve()) for p in (roles_paths or [])] or None,
-        collections_paths=[str(Path(p).resolve()) for p in (collections_paths or [])] or None,
-        env=env or None,
+        root=_canonical_path(root),
+        inventory=_canonical_path(inventory) if inventory else None,
+        roles_paths=tuple(_canonical_path(p) for p in (roles_paths or [])) or None,
+        collections_paths=tuple(_canonical_path(p) for p in (collections_paths or [])) or None,
+        env=_freeze_env(env),
     )
     if make_default:
         cfg.defaults["project"] = name
@@ -768,14 +1524,20 @@ def list_projects() -> dict[str, Any]:
     cfg = _load_config()
     return {
         "default": cfg.defaults.get("project"),
-        "projects": {k: asdict(v) for k, v in cfg.projects.items()},
+        "projects": _projects_view(cfg),
         "config_path": str(_config_path()),
     }
 
 
 @mcp.tool(name="project-playbooks")
-def project_playbooks(project: str | None = None) -> dict[str, Any]:
-    """Discover playbooks (YAML lists) under the project root."""
+def project_playbooks(project: str | None = None, exclude: list[str] | None = None, max_depth: int | None = None) -> dict[str, Any]:
+    """Discover playbooks (YAML lists) under the project root.
+
+    Args:
+        project: Registered project name (defaults to the configured default project).
+        exclude: Optional glob patterns matched against paths relative to the project root (e.g. 'tests/*').
+        max_depth: Directory levels below the root to search (default 8; 0 = root only).
+    """
     cfg = _load_config()
     defn = _resolve_project(cfg, project)
     if not defn:
@@ -783,11 +1545,12 @@ def project_playbooks(project: str | None = None) -> dict[str, Any]:
     root = Path(defn.root)
     if not root.exists():
         return {"ok": False, "error": f"Project root not found: {root}"}
-    return {"ok": True, "root": str(root), "playbooks": _discover_playbooks(root)}
+    depth = _DISCOVERY_MAX_DEPTH if max_depth is None else max(0, max_depth)
+    return {"ok": True, "root": str(root), "playbooks": _discover_playbooks(root, exclude, depth)}
 
 
 @mcp.tool(name="project-run-playbook")
-def project_run_playbook(playbook_path: str, project: str | None = None, extra_vars: dict[str, Any] | None = None, tags: list[str] | None = None, skip_tags: list[str] | None = None, limit: str | None = None, check: bool | None = None, diff: bool | None = None, verbose: int | None = None) -> dict[str, Any]:
+async def project_run_playbook(playbook_path: str, project: str | None = None, extra_vars: dict[str, Any] | None = None, tags: list[str] | None = None, skip_tags: list[str] | None = None, limit: str | None = None, check: bool | None = None, diff: bool | None = None, verbose: int | None = None) -> dict[str, Any]:
     """Run a playbook within a registered project, applying its inventory and environment."""
     cfg = _load_config()
     defn = _resolve_project(cfg, project)
@@ -795,7 +1558,7 @@ def project_run_playbook(playbook_path: str, project: str | None = None, extra_v
         return {"ok": False, "error": "No project specified and no default set"}
     env = _project_env(defn)
     cwd = defn.root
-    return ansible_playbook(
+    return await ansible_playbook(
         playbook_path=str(Path(playbook_path).resolve()),
         inventory=defn.inventory,
         extra_vars=extra_vars,
@@ -810,50 +1573,236 @@ def project_run_playbook(playbook_path: str, project: str | None = None, extra_v
     )
 
 
+def _cfg_sets_strategy(cfg_file: str | None) -> bool:
+    if not cfg_file:
+        return False
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        parser.read(cfg_file, encoding="utf-8")
+    except (configparser.Error, UnicodeDecodeError):
+        return False
+    return bool(parser.get("defaults", "strategy", fallback=None))
+
+
+# Upper bound on --forks for batch runs; each fork is a full Python worker process
+_BATCH_MAX_FORKS = 50
+# ansible's own default --forks; a derived batch value never goes below it
+_ANSIBLE_DEFAULT_FORKS = 5
+
+
+@mcp.tool(name="project-run-playbook-batch")
+async def project_run_playbook_batch(playbook_path: str, hosts: list[str], project: str | None = None, extra_vars: dict[str, Any] | None = None, tags: list[str] | None = None, skip_tags: list[str] | None = None, check: bool | None = None, diff: bool | None = None, verbose: int | None = None, forks: int | None = None) -> dict[str, Any]:
+    """Run a playbook against many hosts in one ansible-playbook invocation.
+
+    Instead of one run per host, the hosts are passed as a single --limit with --forks sized
+    to the batch, and the free strategy lets each host advance through tasks independently
+    (unless ANSIBLE_STRATEGY is already set in the server or project env, the active
+    ansible.cfg sets [defaults] strategy, or the play pins its own strategy).
+
+    Args:
+        playbook_path: Path to the playbook file.
+        hosts: Inventory hostnames (or patterns) to target.
+        project: Registered project name (defaults to the configured default project).
+        forks: Maximum parallel hosts, passed through as given. By default one per entry in
+            ``hosts``, between 5 (ansible's default, since entries may be patterns) and 50.
+    """
+    if not hosts:
+        return {"ok": False, "error": "No hosts given"}
+    cfg = _load_config()
+    defn = _resolve_project(cfg, project)
+    if not defn:
+        return {"ok": False, "error": "No project specified and no default set"}
+    env = dict(_project_env(defn))
+    # the env var outranks ansible.cfg, so a strategy chosen there is left alone
+    if "ANSIBLE_STRATEGY" not in os.environ and "ANSIBLE_STRATEGY" not in env and not _cfg_sets_strategy(_ansible_cfg_file(defn.root, env)):
+        env["ANSIBLE_STRATEGY"] = "free"
+    return await ansible_playbook(
+        playbook_path=str(Path(playbook_path).resolve()),
+        inventory=defn.inventory,
+        extra_vars=extra_vars,
+        tags=tags,
+        skip_tags=skip_tags,
+        limit=",".join(hosts),
+        cwd=defn.root,
+        check=check,
+        diff=diff,
+        verbose=verbose,
+        env=env,
+        forks=forks or max(_ANSIBLE_DEFAULT_FORKS, min(len(hosts), _BATCH_MAX_FORKS)),
+    )
+
+
+def _has_bytes(path: Path, data: bytes) -> bool:
+    """True if ``path`` already holds exactly ``data`` (size checked before reading)."""
+    try:
+        return os.stat(path).st_size == len(data) and path.read_bytes() == data
+    except OSError:
+        return False
+
+
 @mcp.tool(name="create-playbook")
 def create_playbook(playbook: Any, output_path: str | None = None) -> dict[str, Any]:
     """Create an Ansible playbook from YAML string or object.
 
     Args:
         playbook: YAML string or Python object representing the playbook.
-        output_path: Optional path to write the playbook file. If not provided, a temp file is created.
+        output_path: Optional path to write the playbook file. If not provided, it goes to a temp file
+            named after its content, so identical playbooks reuse the same file.
     Returns:
         A dict with keys: path, bytes_written, preview
     """
     yaml_text = _serialize_playbook(playbook)
+    data = yaml_text.encode("utf-8")
+    private_dir = None if output_path else _private_tmp_dir()
     if output_path:
         path = Path(output_path).resolve()
-        _ensure_directory(path.parent)
+        if not _has_bytes(path, data):
+            _ensure_directory(path.parent)
+            path.write_bytes(data)
+    elif private_dir is not None:
+        # content-addressed: identical playbooks (e.g. repeated ansible-role calls) share one file
+        path = private_dir / f"playbook_{hashlib.blake2b(data, digest_size=16).hexdigest()}.yml"
+        if not _has_bytes(path, data):
+            fd, name = tempfile.mkstemp(prefix="playbook_", suffix=".tmp", dir=private_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(name, path)
     else:
-        tmp = tempfile.NamedTemporaryFile(prefix="playbook_", suffix=".yml", delete=False)
-        path = Path(tmp.name)
-        tmp.close()
-    data = yaml_text.encode("utf-8")
-    path.write_bytes(data)
-    preview = "\n".join(yaml_text.splitlines()[:50])
+        # write through the descriptor mkstemp already opened instead of reopening by name
+        fd, name = tempfile.mkstemp(prefix="playbook_", suffix=".yml")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        path = Path(name)
+    # first 50 lines as splitlines() sees them; only split the prefix up to the 50th
+    # newline, which already holds at least 50 complete lines
+    end = -1
+    for _ in range(50):
+        end = yaml_text.find("\n", end + 1)
+        if end < 0:
+            break
+    head = yaml_text if end < 0 else yaml_text[:end + 1]
+    preview = "\n".join(head.splitlines()[:50])
     return {"path": str(path), "bytes_written": len(data), "preview": preview}
 
 
+# Passing syntax checks: key -> (expires_at, fingerprint, result). Same scheme as the
+# inventory cache; the fingerprint covers the playbook tree and every role/collection
+# search directory, and the TTL bounds staleness for anything else (e.g. vars_files
+# outside the tree).
+_SYNTAX_CACHE: dict[tuple, tuple[float, tuple, dict[str, Any]]] = {}
+_SYNTAX_CACHE_TTL = 60.0
+_SYNTAX_CACHE_MAX = 64
+# skipped when fingerprinting the playbook dir; roles and collections can change the verdict
+_SYNTAX_PRUNED_DIRS = _EXCLUDED_DIRS - {"roles", "collections"}
+# (env vars, [defaults] keys, ansible's built-in default) for each content search path
+_ROLES_SEARCH = (("ANSIBLE_ROLES_PATH",), ("roles_path",), "~/.ansible/roles:/usr/share/ansible/roles:/etc/ansible/roles")
+_COLLECTIONS_SEARCH = (
+    ("ANSIBLE_COLLECTIONS_PATH", "ANSIBLE_COLLECTIONS_PATHS"),
+    ("collections_path", "collections_paths"),
+    "~/.ansible/collections:/usr/share/ansible/collections",
+)
+
+
+def _search_dirs(cfg_file: str | None, parser: configparser.ConfigParser, spec: tuple) -> list[str]:
+    """Directories ansible searches for roles or collections, resolved like ansible does."""
+    env_names, cfg_keys, default = spec
+    value, rel_base = None, os.getcwd()
+    for name in env_names:
+        value = os.environ.get(name)
+        if value:
+            break
+    if not value and cfg_file:
+        for key in cfg_keys:
+            value = parser.get("defaults", key, fallback=None)
+            if value:
+                # relative entries in ansible.cfg are relative to the file itself
+                rel_base = os.path.dirname(cfg_file)
+                break
+    entries = (value or default).split(os.pathsep)
+    return [os.path.join(rel_base, os.path.expanduser(p.strip())) for p in entries if p.strip()]
+
+
+def _syntax_fingerprint(base: str, playbook: str, inventory: str | None) -> tuple:
+    cfg_file = _ansible_cfg_file(base, None)
+    parser = configparser.ConfigParser(interpolation=None)
+    if cfg_file:
+        try:
+            parser.read(cfg_file, encoding="utf-8")
+        except (configparser.Error, UnicodeDecodeError):
+            pass
+    paths = [cfg_file, os.path.dirname(playbook)]
+    if inventory and "," not in inventory:
+        paths.append(os.path.join(base, os.path.expanduser(inventory)))
+    paths += _search_dirs(cfg_file, parser, _ROLES_SEARCH)
+    paths += _search_dirs(cfg_file, parser, _COLLECTIONS_SEARCH)
+    ansible_env = tuple(sorted(item for item in os.environ.items() if item[0].startswith("ANSIBLE_")))
+    return tuple((p, _tree_mtime(p, _SYNTAX_PRUNED_DIRS)) for p in paths if p) + ansible_env
+
+
 @mcp.tool(name="validate-playbook")
-def validate_playbook(playbook_path: str, inventory: str | None = None, cwd: str | None = None) -> dict[str, Any]:
+async def validate_playbook(playbook_path: str, inventory: str | None = None, cwd: str | None = None, refresh: bool | None = None) -> dict[str, Any]:
     """Validate playbook syntax using ansible-playbook --syntax-check.
 
+    A passing result is reused until the playbook's directory tree, the inventory, the
+    active ansible.cfg or a role/collection search directory changes (or for at most a minute).
+
     Args:
         playbook_path: Path to the playbook file.
         inventory: Optional inventory path or host list.
         cwd: Optional working directory to run the command in.
+        refresh: Bypass the cache and re-run the syntax check
     Returns:
         A dict with keys: ok (bool), rc, stdout, stderr
     """
     cmd: list[str] = ["ansible-playbook", "--syntax-check", playbook_path]
     if inventory:
         cmd.extend(["-i", inventory])
-    rc, out, err = _run_command(cmd, cwd=Path(cwd) if cwd else None)
-    return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err}
+    base = cwd or os.getcwd()
+    key = (base, tuple(cmd))
+    if refresh:
+        # plain re-run: no fingerprint walk, and nothing stale left behind
+        _SYNTAX_CACHE.pop(key, None)
+        rc, out, err = await _arun_command(cmd, cwd=Path(cwd) if cwd else None)
+        return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err}
+    fingerprint = _syntax_fingerprint(base, os.path.join(base, playbook_path), inventory)
+    cached = _SYNTAX_CACHE.get(key)
+    if cached is not None and cached[0] > time.monotonic() and cached[1] == fingerprint:
+        return dict(cached[2])
+    rc, out, err = await _arun_command(cmd, cwd=Path(cwd) if cwd else None)
+    result = {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err}
+    if rc == 0:
+        _SYNTAX_CACHE.pop(key, None)
+        if len(_SYNTAX_CACHE) >= _SYNTAX_CACHE_MAX:
+            # evict the oldest entry (dicts keep insertion order)
+            _SYNTAX_CACHE.pop(next(iter(_SYNTAX_CACHE)), None)
+        _SYNTAX_CACHE[key] = (time.monotonic() + _SYNTAX_CACHE_TTL, fingerprint, dict(result))
+    return result
+
+
+# SSH connection reuse: one master connection per host is kept for 10 minutes and later
+# tasks (and later runs) multiplex over it; pipelining sends modules over stdin instead
+# of copying them to a remote temp file first
+_CONNECTION_DEFAULTS = (
+    ("ANSIBLE_SSH_ARGS", "-C -o ControlMaster=auto -o ControlPersist=600s"),
+    ("ANSIBLE_PIPELINING", "True"),
+)
+
+
+def _with_connection_defaults(env: dict[str, str] | None, cwd: str | None) -> dict[str, str] | None:
+    # environment variables outrank ansible.cfg, so only fill in when no config file is in
+    # play; anything already set in the process or call env is left alone
+    if _ansible_cfg_file(cwd or os.getcwd(), env) is not None:
+        return env
+    missing = [(key, value) for key, value in _CONNECTION_DEFAULTS if key not in os.environ and not (env and key in env)]
+    if not missing:
+        return env
+    merged = dict(env) if env else {}
+    merged.update(missing)
+    return merged
 
 
 @mcp.tool(name="ansible-playbook")
-def ansible_playbook(playbook_path: str, inventory: str | None = None, extra_vars: dict[str, Any] | None = None, tags: list[str] | None = None, skip_tags: list[str] | None = None, limit: str | None = None, cwd: str | None = None, check: bool | None = None, diff: bool | None = None, verbose: int | None = None, env: dict[str, str] | None = None) -> dict[str, Any]:
+async def ansible_playbook(playbook_path: str, inventory: str | None = None, extra_vars: dict[str, Any] | None = None, tags: list[str] | None = None, skip_tags: list[str] | None = None, limit: str | None = None, cwd: str | None = None, check: bool | None = None, diff: bool | None = None, verbose: int | None = None, env: dict[str, str] | None = None, forks: int | None = None, strategy: str | None = None) -> dict[str, Any]:
     """Run an Ansible playbook.
 
     Args:
@@ -867,32 +1816,38 @@ def ansible_playbook(playbook_path: str, inventory: str | None = None, extra_var
         check: If true, run in check mode.
         diff: If true, show diffs.
         verbose: Verbosity level (1-4) corresponding to -v, -vv, -vvv, -vvvv.
+        forks: Number of parallel host processes (--forks).
+        strategy: Strategy plugin for plays that don't pin one (ANSIBLE_STRATEGY), e.g. 'free'
+            or 'mitogen_linear' when Mitogen is installed.
     Returns:
-        A dict with keys: ok (bool), rc, stdout, stderr, command
+        A dict with keys: ok (bool), rc, stdout, stderr, command (shell string), command_argv
+        (argument list). At verbosity 3+ the full
+        output is written to stdout_path/stderr_path (kept for a day) and stdout/stderr hold
+        only the tail.
     """
     cmd: list[str] = ["ansible-playbook", playbook_path]
+    # bound once; this builder runs on every playbook request
+    extend = cmd.extend
     if inventory:
-        cmd.extend(["-i", inventory])
+        extend(["-i", inventory])
     if extra_vars:
-        cmd.extend(["--extra-vars", json.dumps(extra_vars)])
+        extend(["--extra-vars", _json_text(extra_vars)])
     if tags:
-        cmd.extend(["--tags", ",".join(tags)])
+        extend(["--tags", ",".join(tags)])
     if skip_tags:
-        cmd.extend(["--skip-tags", ",".join(skip_tags)])
+        extend(["--skip-tags", ",".join(skip_tags)])
     if limit:
-        cmd.extend(["--limit", limit])
-    if check:
-        cmd.append("--check")
-    if diff:
-        cmd.append("--diff")
-    if verbose:
-        cmd.append("-" + ("v" * max(1, min(verbose, 4))))
-    rc, out, err = _run_command(cmd, cwd=Path(cwd) if cwd else None, env=env)
-    return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(cmd)}
+        extend(["--limit", limit])
+    if forks:
+        extend(["--forks", str(forks)])
+    extend(_mode_flags(bool(check), bool(diff), verbose or 0))
+    if strategy:
+        env = {**env, "ANSIBLE_STRATEGY": strategy} if env else {"ANSIBLE_STRATEGY": strategy}
+    return await _arun_cli(cmd, Path(cwd) if cwd else None, _with_connection_defaults(env, cwd), verbose)
 
 
 @mcp.tool(name="ansible-task")
-def ansible_task(host_pattern: str, module: str, args: dict[str, Any] | str | None = None, inventory: str | None = None, become: bool | None = None, become_user: str | None = None, check: bool | None = None, diff: bool | None = None, cwd: str | None = None, verbose: int | None = None, connection: str | None = None, env: dict[str, str] | None = None) -> dict[str, Any]:
+async def ansible_task(host_pattern: str, module: str, args: dict[str, Any] | str | None = None, inventory: str | None = None, become: bool | None = None, become_user: str | None = None, check: bool | None = None, diff: bool | None = None, cwd: str | None = None, verbose: int | None = None, connection: str | None = None, env: dict[str, str] | None = None) -> dict[str, Any]:
     """Run an ad-hoc Ansible task using the ansible CLI.
 
     Args:
@@ -908,38 +1863,36 @@ def ansible_task(host_pattern: str, module: str, args: dict[str, Any] | str | No
         verbose: Verbosity level 1-4
         connection: Connection type (e.g., 'local', 'ssh'). Defaults to 'local' when targeting localhost.
     Returns:
-        A dict with keys: ok (bool), rc, stdout, stderr, command
+        A dict with keys: ok (bool), rc, stdout, stderr, command (shell string), command_argv
+        (argument list). At verbosity 3+ the full
+        output is written to stdout_path/stderr_path (kept for a day) and stdout/stderr hold
+        only the tail.
     """
     cmd: list[str] = ["ansible", host_pattern, "-m", module]
+    extend, append = cmd.extend, cmd.append
     if args is not None:
         if isinstance(args, dict):
-            cmd.extend(["-a", _dict_to_module_args(args)])
+            extend(["-a", _dict_to_module_args(args)])
         else:
-            cmd.extend(["-a", str(args)])
+            extend(["-a", str(args)])
     if inventory:
-        cmd.extend(["-i", inventory])
+        extend(["-i", inventory])
     # Default to local connection when targeting localhost, unless explicitly overridden
     use_conn = connection
     if use_conn is None and host_pattern in {"localhost", "127.0.0.1"}:
         use_conn = "local"
     if use_conn:
-        cmd.extend(["-c", use_conn])
+        extend(["-c", use_conn])
     if become:
-        cmd.append("--become")
+        append("--become")
     if become_user:
-        cmd.extend(["--become-user", become_user])
-    if check:
-        cmd.append("--check")
-    if diff:
-        cmd.append("--diff")
-    if verbose:
-        cmd.append("-" + ("v" * max(1, min(verbose, 4))))
-    rc, out, err = _run_command(cmd, cwd=Path(cwd) if cwd else None, env=env)
-    return {"ok": rc == 0, "rc": rc, "stdout": out, "stderr": err, "command": shlex.join(cmd)}
+        extend(["--become-user", become_user])
+    extend(_mode_flags(bool(check), bool(diff), verbose or 0))
+    return await _arun_cli(cmd, Path(cwd) if cwd else None, _with_connection_defaults(env, cwd), verbose)
 
 
 @mcp.tool(name="ansible-role")
-def ansible_role(role_name: str, hosts: str = "all", inventory: str | None = None, vars: dict[str, Any] | None = None, cwd: str | None = None, check: bool | None = None, diff: bool | None = None, verbose: int | None = None, env: dict[str, str] | None = None) -> dict[str, Any]:
+async def ansible_role(role_name: str, hosts: str = "all", inventory: str | None = None, vars: dict[str, Any] | None = None, cwd: str | None = None, check: bool | None = None, diff: bool | None = None, verbose: int | None = None, env: dict[str, str] | None = None) -> dict[str, Any]:
     """Execute an Ansible role by generating a temporary playbook.
 
     Args:
@@ -964,7 +1917,7 @@ def ansible_role(role_name: str, hosts: str = "all", inventory: str | None = Non
         }
     ]
     tmp = create_playbook(playbook_obj)
-    return ansible_playbook(
+    return await ansible_playbook(
         playbook_path=tmp["path"],
         inventory=inventory,
         cwd=cwd,
@@ -975,6 +1928,9 @@ def ansible_role(role_name: str, hosts: str = "all", inventory: str | None = Non
     )
 
 
+_MAIN_YML = b"---\n"
+
+
 @mcp.tool(name="create-role-structure")
 def create_role_structure(base_path: str, role_name: str) -> dict[str, Any]:
     """Generate the standard Ansible role directory structure.
@@ -987,6 +1943,7 @@ def create_role_structure(base_path: str, role_name: str) -> dict[str, Any]:
     """
     base = Path(base_path).resolve()
     role_dir = base / role_name
+    role_root = str(role_dir)
     subdirs = [
         "defaults",
         "files",
@@ -998,16 +1955,28 @@ def create_role_structure(base_path: str, role_name: str) -> dict[str, Any]:
         "vars",
     ]
     created: list[str] = []
+    # parents once; then a bare mkdir per subdirectory instead of makedirs' stat-then-mkdir
+    os.makedirs(role_root, exist_ok=True)
     for sub in subdirs:
-        target = role_dir / sub
-        _ensure_directory(target)
-        created.append(str(target))
-    # create main.yml for common directories
+        target = os.path.join(role_root, sub)
+        try:
+            os.mkdir(target)
+        except FileExistsError:
+            if not os.path.isdir(target):
+                raise
+        created.append(target)
+    # create main.yml for common directories; O_EXCL fails atomically if it already exists
     for sub in ("defaults", "handlers", "meta", "tasks", "vars"):
-        main_file = role_dir / sub / "main.yml"
-        if not main_file.exists():
-            main_file.write_text("---\n", encoding="utf-8")
-            created.append(str(main_file))
+        main_file = os.path.join(role_root, sub, "main.yml")
+        try:
+            fd = os.open(main_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            continue
+        try:
+            os.write(fd, _MAIN_YML)
+        finally:
+            os.close(fd)
+        created.append(main_file)
     return {"created": created, "role_path": str(role_dir)}
 
 
@@ -1017,17 +1986,7 @@ def create_role_structure(base_path: str, role_name: str) -> dict[str, Any]:
 
 def _parse_json_output(stdout: str) -> dict[str, Any]:
     """Parse JSON output from Ansible modules that return structured data."""
-    facts: dict[str, Any] = {}
-    for line in stdout.splitlines():
-        if "SUCCESS" in line and "=>" in line:
-            try:
-                left, right = line.split("=>", 1)
-                host = left.split("|")[0].strip()
-                data = json.loads(right.strip())
-                facts[host] = data
-            except Exception:
-                continue
-    return facts
+    return dict(_iter_success_json(stdout))
 
 
 def _calculate_health_score(metrics: dict[str, Any]) -> dict[str, Any]:
@@ -1132,7 +2091,7 @@ def _analyze_log_patterns(logs: str) -> dict[str, Any]:
 
 
 @mcp.tool(name="ansible-remote-command")
-def ansible_remote_command(host_pattern: str, command: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, become: bool | None = None, timeout: int | None = None) -> dict[str, Any]:
+async def ansible_remote_command(host_pattern: str, command: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, become: bool | None = None, timeout: int | None = None) -> dict[str, Any]:
     """Execute arbitrary shell commands on remote hosts with enhanced output parsing.
     
     Args:
@@ -1151,7 +2110,7 @@ def ansible_remote_command(host_pattern: str, command: str, project_root: str |
     if timeout:
         args["timeout"] = timeout
     
-    result = ansible_task(
+    result = await ansible_task(
         host_pattern=host_pattern,
         module="shell",
         args=args,
@@ -1171,7 +2130,7 @@ def ansible_remote_command(host_pattern: str, command: str, project_root: str |
 
 
 @mcp.tool(name="ansible-fetch-logs")
-def ansible_fetch_logs(host_pattern: str, log_paths: list[str], project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, lines: int | None = 100, filter_pattern: str | None = None, analyze: bool | None = True) -> dict[str, Any]:
+async def ansible_fetch_logs(host_pattern: str, log_paths: list[str], project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, lines: int | None = 100, filter_pattern: str | None = None, analyze: bool | None = True) -> dict[str, Any]:
     """Fetch and analyze log files from remote hosts.
     
     Args:
@@ -1197,7 +2156,7 @@ def ansible_fetch_logs(host_pattern: str, log_paths: list[str], project_root: st
         
         command = " | ".join(cmd_parts)
         
-        result = ansible_task(
+        result = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": command},
@@ -1226,7 +2185,7 @@ def ansible_fetch_logs(host_pattern: str, log_paths: list[str], project_root: st
 
 
 @mcp.tool(name="ansible-service-manager")
-def ansible_service_manager(host_pattern: str, service_name: str, action: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, check_logs: bool | None = True) -> dict[str, Any]:
+async def ansible_service_manager(host_pattern: str, service_name: str, action: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, check_logs: bool | None = True) -> dict[str, Any]:
     """Manage services with status checking and log correlation.
     
     Args:
@@ -1242,7 +2201,7 @@ def ansible_service_manager(host_pattern: str, service_name: str, action: str, p
     inventory_str = ",".join(inventory_paths) if inventory_paths else None
     
     # Execute service action
-    result = ansible_task(
+    result = await ansible_task(
         host_pattern=host_pattern,
         module="systemd",
         args={"name": service_name, "state": action if action != "status" else None},
@@ -1252,7 +2211,7 @@ def ansible_service_manager(host_pattern: str, service_name: str, action: str, p
     )
     
     # Get service status
-    status_result = ansible_task(
+    status_result = await ansible_task(
         host_pattern=host_pattern,
         module="service_facts",
         inventory=inventory_str,
@@ -1263,7 +2222,7 @@ def ansible_service_manager(host_pattern: str, service_name: str, action: str, p
     # Fetch recent logs if requested
     logs = {}
     if check_logs:
-        log_result = ansible_task(
+        log_result = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": f"journalctl -u {service_name} -n 20 --no-pager"},
@@ -1284,7 +2243,7 @@ def ansible_service_manager(host_pattern: str, service_name: str, action: str, p
 
 
 @mcp.tool(name="ansible-diagnose-host")
-def ansible_diagnose_host(host_pattern: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, checks: list[str] | None = None, baseline_compare: bool | None = False, include_recommendations: bool | None = True) -> dict[str, Any]:
+async def ansible_diagnose_host(host_pattern: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, checks: list[str] | None = None, baseline_compare: bool | None = False, include_recommendations: bool | None = True) -> dict[str, Any]:
     """Comprehensive health assessment of target hosts.
     
     Args:
@@ -1305,7 +2264,7 @@ def ansible_diagnose_host(host_pattern: str, project_root: str | None = None, an
     # System health check
     if "system" in check_types:
         # CPU, memory, disk usage
-        system_result = ansible_task(
+        system_result = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "df -h / | tail -1 | awk '{print $5}' | sed 's/%//'; free | grep Mem | awk '{print ($3/$2)*100}'; top -bn1 | grep 'Cpu(s)' | awk '{print $2}' | sed 's/%us,//'"},
@@ -1336,7 +2295,7 @@ def ansible_diagnose_host(host_pattern: str, project_root: str | None = None, an
     
     # Network health check
     if "network" in check_types:
-        network_result = ansible_task(
+        network_result = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "ping -c 3 8.8.8.8 > /dev/null 2>&1 && echo 'reachable' || echo 'unreachable'"},
@@ -1351,7 +2310,7 @@ def ansible_diagnose_host(host_pattern: str, project_root: str | None = None, an
     
     # Security check
     if "security" in check_types:
-        security_result = ansible_task(
+        security_result = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "last -n 5 | grep -v 'wtmp begins' | wc -l; ps aux | grep -v grep | grep -E '(ssh|telnet|ftp)' | wc -l"},
@@ -1367,7 +2326,7 @@ def ansible_diagnose_host(host_pattern: str, project_root: str | None = None, an
     
     # Performance check
     if "performance" in check_types:
-        perf_result = ansible_task(
+        perf_result = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "uptime | awk '{print $(NF-2), $(NF-1), $NF}' | tr -d ','"},
@@ -1399,7 +2358,7 @@ def ansible_diagnose_host(host_pattern: str, project_root: str | None = None, an
 
 
 @mcp.tool(name="ansible-capture-baseline")
-def ansible_capture_baseline(host_pattern: str, snapshot_name: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, include: list[str] | None = None) -> dict[str, Any]:
+async def ansible_capture_baseline(host_pattern: str, snapshot_name: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, include: list[str] | None = None) -> dict[str, Any]:
     """Capture comprehensive system state baseline for later comparison.
     
     Args:
@@ -1425,7 +2384,7 @@ def ansible_capture_baseline(host_pattern: str, snapshot_name: str, project_root
     
     # Capture process information
     if "processes" in categories:
-        proc_result = ansible_task(
+        proc_result = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "ps aux --sort=-%cpu | head -20"},
@@ -1437,7 +2396,7 @@ def ansible_capture_baseline(host_pattern: str, snapshot_name: str, project_root
     
     # Capture network configuration
     if "network" in categories:
-        net_result = ansible_task(
+        net_result = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "ip addr show; netstat -tuln"},
@@ -1449,7 +2408,7 @@ def ansible_capture_baseline(host_pattern: str, snapshot_name: str, project_root
     
     # Capture system configuration
     if "configs" in categories:
-        config_result = ansible_task(
+        config_result = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "uname -a; cat /etc/os-release; systemctl list-units --failed"},
@@ -1461,7 +2420,7 @@ def ansible_capture_baseline(host_pattern: str, snapshot_name: str, project_root
     
     # Capture performance metrics
     if "performance" in categories:
-        perf_result = ansible_task(
+        perf_result = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "vmstat 1 3; iostat -x 1 3"},
@@ -1484,7 +2443,7 @@ def ansible_capture_baseline(host_pattern: str, snapshot_name: str, project_root
 
 
 @mcp.tool(name="ansible-compare-states")
-def ansible_compare_states(host_pattern: str, baseline_snapshot_id: str, current_snapshot_name: str | None = None, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None) -> dict[str, Any]:
+async def ansible_compare_states(host_pattern: str, baseline_snapshot_id: str, current_snapshot_name: str | None = None, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None) -> dict[str, Any]:
     """Compare current system state against a previously captured baseline.
     
     Args:
@@ -1497,7 +2456,7 @@ def ansible_compare_states(host_pattern: str, baseline_snapshot_id: str, current
     """
     # Capture current state
     current_name = current_snapshot_name or f"current_{datetime.now().strftime('%H%M%S')}"
-    current_state = ansible_capture_baseline(
+    current_state = await ansible_capture_baseline(
         host_pattern=host_pattern,
         snapshot_name=current_name,
         project_root=project_root,
@@ -1530,7 +2489,7 @@ def ansible_compare_states(host_pattern: str, baseline_snapshot_id: str, current
 
 
 @mcp.tool(name="ansible-auto-heal")
-def ansible_auto_heal(host_pattern: str, symptoms: list[str], project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, max_impact: str | None = "low", dry_run: bool | None = True) -> dict[str, Any]:
+async def ansible_auto_heal(host_pattern: str, symptoms: list[str], project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, max_impact: str | None = "low", dry_run: bool | None = True) -> dict[str, Any]:
     """Intelligent automated problem resolution with safety checks.
     
     Args:
@@ -1604,7 +2563,7 @@ def ansible_auto_heal(host_pattern: str, symptoms: list[str], project_root: str
         # Execute healing actions
         for action in allowed_actions:
             # Run safety check first
-            safety_result = ansible_task(
+            safety_result = await ansible_task(
                 host_pattern=host_pattern,
                 module="shell",
                 args={"_raw_params": action["safety_check"]},
@@ -1614,7 +2573,7 @@ def ansible_auto_heal(host_pattern: str, symptoms: list[str], project_root: str
             )
             
             # Execute healing action
-            heal_result = ansible_task(
+            heal_result = await ansible_task(
                 host_pattern=host_pattern,
                 module="shell",
                 args={"_raw_params": action["command"]},
@@ -1648,7 +2607,7 @@ def ansible_auto_heal(host_pattern: str, symptoms: list[str], project_root: str
 
 
 @mcp.tool(name="ansible-network-matrix")
-def ansible_network_matrix(host_patterns: list[str], target_hosts: list[str] | None = None, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, check_ports: list[int] | None = None) -> dict[str, Any]:
+async def ansible_network_matrix(host_patterns: list[str], target_hosts: list[str] | None = None, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, check_ports: list[int] | None = None) -> dict[str, Any]:
     """Comprehensive network connectivity matrix between hosts.
     
     Args:
@@ -1669,7 +2628,7 @@ def ansible_network_matrix(host_patterns: list[str], target_hosts: list[str] | N
         matrix_results[host_pattern] = {}
         
         # Get the actual hosts for this pattern first
-        hosts_result = ansible_task(
+        hosts_result = await ansible_task(
             host_pattern=host_pattern,
             module="setup",
             args={"gather_subset": "!all,network"},
@@ -1681,7 +2640,7 @@ def ansible_network_matrix(host_patterns: list[str], target_hosts: list[str] | N
         targets = target_hosts or host_patterns
         for target in targets:
             # Ping test
-            ping_result = ansible_task(
+            ping_result = await ansible_task(
                 host_pattern=host_pattern,
                 module="shell",
                 args={"_raw_params": f"ping -c 3 {target} > /dev/null 2>&1 && echo 'success' || echo 'failed'"},
@@ -1693,7 +2652,7 @@ def ansible_network_matrix(host_patterns: list[str], target_hosts: list[str] | N
             # Port connectivity tests
             port_results = {}
             for port in ports:
-                port_test = ansible_task(
+                port_test = await ansible_task(
                     host_pattern=host_pattern,
                     module="shell",
                     args={"_raw_params": f"nc -z -w5 {target} {port} && echo 'open' || echo 'closed'"},
@@ -1704,7 +2663,7 @@ def ansible_network_matrix(host_patterns: list[str], target_hosts: list[str] | N
                 port_results[port] = port_test.get("stdout", "").strip()
             
             # Traceroute
-            traceroute_result = ansible_task(
+            traceroute_result = await ansible_task(
                 host_pattern=host_pattern,
                 module="shell",
                 args={"_raw_params": f"traceroute -m 10 {target} 2>/dev/null | tail -1"},
@@ -1731,7 +2690,7 @@ def ansible_network_matrix(host_patterns: list[str], target_hosts: list[str] | N
 
 
 @mcp.tool(name="ansible-security-audit")
-def ansible_security_audit(host_pattern: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, audit_categories: list[str] | None = None, generate_report: bool | None = True) -> dict[str, Any]:
+async def ansible_security_audit(host_pattern: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, audit_categories: list[str] | None = None, generate_report: bool | None = True) -> dict[str, Any]:
     """Comprehensive security audit and vulnerability assessment.
     
     Args:
@@ -1751,7 +2710,7 @@ def ansible_security_audit(host_pattern: str, project_root: str | None = None, a
     # Package vulnerability audit
     if "packages" in categories:
         # Check for packages with known vulnerabilities
-        package_audit = ansible_task(
+        package_audit = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "apt list --upgradable 2>/dev/null | grep -E '(security|CVE)' | wc -l || yum check-update --security 2>/dev/null | grep -c 'needed for security' || echo '0'"},
@@ -1761,7 +2720,7 @@ def ansible_security_audit(host_pattern: str, project_root: str | None = None, a
         )
         
         # Check for outdated packages
-        outdated_packages = ansible_task(
+        outdated_packages = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "apt list --upgradable 2>/dev/null | wc -l || yum check-update 2>/dev/null | wc -l"},
@@ -1778,7 +2737,7 @@ def ansible_security_audit(host_pattern: str, project_root: str | None = None, a
     # Permission and access audit
     if "permissions" in categories:
         # Check for SUID/SGID files
-        suid_check = ansible_task(
+        suid_check = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "find /usr /bin /sbin -perm -4000 -o -perm -2000 2>/dev/null | wc -l"},
@@ -1788,7 +2747,7 @@ def ansible_security_audit(host_pattern: str, project_root: str | None = None, a
         )
         
         # Check for world-writable files
-        writable_check = ansible_task(
+        writable_check = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "find / -maxdepth 3 -perm -002 -type f 2>/dev/null | grep -v '/proc\\|/sys\\|/dev' | wc -l"},
@@ -1805,7 +2764,7 @@ def ansible_security_audit(host_pattern: str, project_root: str | None = None, a
     # Network security audit
     if "network" in categories:
         # Open ports scan
-        open_ports = ansible_task(
+        open_ports = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "netstat -tuln | grep LISTEN | wc -l"},
@@ -1815,7 +2774,7 @@ def ansible_security_audit(host_pattern: str, project_root: str | None = None, a
         )
         
         # Check for unnecessary services
-        services_check = ansible_task(
+        services_check = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "systemctl list-units --type=service --state=running | grep -E '(telnet|ftp|rsh|rlogin)' | wc -l"},
@@ -1832,7 +2791,7 @@ def ansible_security_audit(host_pattern: str, project_root: str | None = None, a
     # Configuration audit
     if "config" in categories:
         # SSH configuration check
-        ssh_config = ansible_task(
+        ssh_config = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "grep -E '^PermitRootLogin|^PasswordAuthentication|^Protocol' /etc/ssh/sshd_config 2>/dev/null || echo 'SSH config not accessible'"},
@@ -1842,7 +2801,7 @@ def ansible_security_audit(host_pattern: str, project_root: str | None = None, a
         )
         
         # Password policy check
-        password_policy = ansible_task(
+        password_policy = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "grep -E '^PASS_MAX_DAYS|^PASS_MIN_DAYS|^PASS_WARN_AGE' /etc/login.defs 2>/dev/null | wc -l"},
@@ -1896,7 +2855,7 @@ def ansible_security_audit(host_pattern: str, project_root: str | None = None, a
 
 
 @mcp.tool(name="ansible-health-monitor")
-def ansible_health_monitor(host_pattern: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, monitoring_duration: int | None = 300, metrics_interval: int | None = 30) -> dict[str, Any]:
+async def ansible_health_monitor(host_pattern: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, monitoring_duration: int | None = 300, metrics_interval: int | None = 30) -> dict[str, Any]:
     """Continuous health monitoring with trend analysis.
     
     Args:
@@ -1920,7 +2879,7 @@ def ansible_health_monitor(host_pattern: str, project_root: str | None = None, a
     
     for i in range(collection_points):
         # Collect current metrics
-        current_metrics = ansible_task(
+        current_metrics = await ansible_task(
             host_pattern=host_pattern,
             module="shell",
             args={"_raw_params": "echo $(date '+%Y-%m-%d %H:%M:%S'),$(cat /proc/loadavg | awk '{print $1}'),$(free | grep Mem | awk '{print ($3/$2)*100}'),$(df / | tail -1 | awk '{print $5}' | sed 's/%//')"},
@@ -1940,7 +2899,7 @@ def ansible_health_monitor(host_pattern: str, project_root: str | None = None, a
         
         # Wait for next interval (except for last iteration)
         if i < collection_points - 1:
-            time.sleep(interval)
+            await asyncio.sleep(interval)
     
     # Analyze trends
     if len(metrics_history) > 1:
@@ -1986,7 +2945,7 @@ def ansible_health_monitor(host_pattern: str, project_root: str | None = None, a
 
 
 @mcp.tool(name="ansible-performance-baseline")
-def ansible_performance_baseline(host_pattern: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, benchmark_duration: int | None = 60, store_baseline: bool | None = True) -> dict[str, Any]:
+async def ansible_performance_baseline(host_pattern: str, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, benchmark_duration: int | None = 60, store_baseline: bool | None = True) -> dict[str, Any]:
     """Establish performance baselines and detect regressions.
     
     Args:
@@ -2004,7 +2963,7 @@ def ansible_performance_baseline(host_pattern: str, project_root: str | None = N
     baseline_results = {"timestamp": datetime.now().isoformat(), "benchmarks": {}}
     
     # CPU benchmark (simple calculation test)
-    cpu_benchmark = ansible_task(
+    cpu_benchmark = await ansible_task(
         host_pattern=host_pattern,
         module="shell",
         args={"_raw_params": f"time (for i in {{1..1000000}}; do echo $((i*i)) > /dev/null; done) 2>&1 | grep real | awk '{{print $2}}'"},
@@ -2015,7 +2974,7 @@ def ansible_performance_baseline(host_pattern: str, project_root: str | None = N
     baseline_results["benchmarks"]["cpu"] = cpu_benchmark.get("stdout", "").strip()
     
     # Memory benchmark (allocate and access memory)
-    memory_benchmark = ansible_task(
+    memory_benchmark = await ansible_task(
         host_pattern=host_pattern,
         module="shell",
         args={"_raw_params": "dd if=/dev/zero of=/tmp/testfile bs=1M count=100 2>&1 | grep -o '[0-9.]* MB/s' | head -1"},
@@ -2026,7 +2985,7 @@ def ansible_performance_baseline(host_pattern: str, project_root: str | None = N
     baseline_results["benchmarks"]["memory"] = memory_benchmark.get("stdout", "").strip()
     
     # Disk I/O benchmark
-    disk_benchmark = ansible_task(
+    disk_benchmark = await ansible_task(
         host_pattern=host_pattern,
         module="shell",
         args={"_raw_params": "dd if=/dev/zero of=/tmp/testfile bs=1M count=100 conv=fdatasync 2>&1 | grep -o '[0-9.]* MB/s' | tail -1; rm -f /tmp/testfile"},
@@ -2037,7 +2996,7 @@ def ansible_performance_baseline(host_pattern: str, project_root: str | None = N
     baseline_results["benchmarks"]["disk_write"] = disk_benchmark.get("stdout", "").strip()
     
     # Network latency test (to local gateway)
-    network_test = ansible_task(
+    network_test = await ansible_task(
         host_pattern=host_pattern,
         module="shell",
         args={"_raw_params": "ping -c 10 $(ip route | grep default | awk '{print $3}' | head -1) | grep 'avg' | awk -F'/' '{print $5}'"},
@@ -2048,7 +3007,7 @@ def ansible_performance_baseline(host_pattern: str, project_root: str | None = N
     baseline_results["benchmarks"]["network_latency"] = network_test.get("stdout", "").strip()
     
     # System load during benchmarks
-    load_test = ansible_task(
+    load_test = await ansible_task(
         host_pattern=host_pattern,
         module="shell",
         args={"_raw_params": "uptime | awk '{print $(NF-2)}' | tr -d ','"},
@@ -2098,7 +3057,7 @@ def ansible_performance_baseline(host_pattern: str, project_root: str | None = N
 
 
 @mcp.tool(name="ansible-log-hunter")
-def ansible_log_hunter(host_pattern: str, search_patterns: list[str], log_paths: list[str] | None = None, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, time_range: str | None = None, correlation_window: int | None = 300) -> dict[str, Any]:
+async def ansible_log_hunter(host_pattern: str, search_patterns: list[str], log_paths: list[str] | None = None, project_root: str | None = None, ansible_cfg_path: str | None = None, inventory_paths: list[str] | None = None, time_range: str | None = None, correlation_window: int | None = 300) -> dict[str, Any]:
     """Advanced log hunting and correlation across multiple sources.
     
     Args:
@@ -2149,7 +3108,7 @@ def ansible_log_hunter(host_pattern: str, search_patterns: list[str], log_paths:
                 # Regular log file search
                 search_cmd = f"grep -E '{pattern}' {log_path} 2>/dev/null | tail -100"
             
-            search_result = ansible_task(
+            search_result = await ansible_task(
                 host_pattern=host_pattern,
                 module="shell",
                 args={"_raw_params": search_cmd},